@@ -7,6 +7,7 @@ import re
 import subprocess
 import time
 from contextlib import contextmanager
+from functools import lru_cache
 
 import requests
 
@@ -468,11 +469,13 @@ CLOUD_DEFAULT_WORKERS = 4
 LOCAL_DEFAULT_WORKERS = 1
 
 
+@lru_cache(maxsize=256)
 def get_model_pricing(model: str) -> dict:
     """Get pricing + config for a model.
 
     Returns dict with keys: input, output ($/1M tokens), batch_size, frequency_penalty.
-    Falls back to zeros for unknown models.
+    Falls back to zeros for unknown models.  Results are memoized per model
+    name (MODEL_PRICING is static), so callers must treat the dict as read-only.
     """
     _defaults = {"input": 0.0, "output": 0.0, "batch_size": 10, "frequency_penalty": 0.0}
     # Exact match first
@@ -2,6 +2,7 @@
 
 import json
 import os
+import sys
 import zipfile
 from collections import defaultdict
 from dataclasses import dataclass, field, asdict
@@ -9,9 +10,13 @@ from datetime import date
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslationEntry:
-    """A single translatable text entry from an RPG Maker project."""
+    """A single translatable text entry from an RPG Maker project.
+
+    Slotted: projects hold tens of thousands of these, and dropping the
+    per-instance ``__dict__`` cuts memory and speeds attribute access.
+    """
     id: str                # Unique key e.g. "Actors/1/name", "Map001/Event3/page0/dialog_5"
     file: str              # Source filename e.g. "Actors.json", "Map001.json"
     field: str             # Field path e.g. "name", "description", "dialog"
@@ -23,6 +28,21 @@ class TranslationEntry:
     has_face: bool = False # True when 101 header has a face graphic (narrower text area)
 
 
+def _intern_entry_fields(entries: list):
+    """Intern the low-cardinality string fields of freshly loaded entries.
+
+    json.load gives every entry its own copy of "translated", "Map001.json",
+    "dialog", ...  Interning shares one object per value (less memory on
+    big projects) and lets status/file/field comparisons against the
+    module literals hit the identity fast path in the filter and paint loops.
+    """
+    intern = sys.intern
+    for e in entries:
+        e.status = intern(e.status)
+        e.file = intern(e.file)
+        e.field = intern(e.field)
+
+
 @dataclass
 class TranslationProject:
     """Holds all translation entries for an RPG Maker project."""
@@ -112,6 +132,7 @@ class TranslationProject:
             TranslationEntry(**{k: v for k, v in e.items() if k in known})
             for e in data.get("entries", [])
         ]
+        _intern_entry_fields(project.entries)
         project.glossary = data.get("glossary", {})
         # JSON converts int keys to strings — convert back to int
         raw_genders = data.get("actor_genders", {})
@@ -342,6 +363,7 @@ class TranslationProject:
 
         project = cls()
         project.entries = [TranslationEntry(**e) for e in data.get("entries", [])]
+        _intern_entry_fields(project.entries)
         project.glossary = data.get("glossary", {})
         raw_genders = data.get("actor_genders", {})
         actor_genders = {}
@@ -27,8 +27,5 @@ def extract_event_context(entry_id: str) -> str:
     # Middle parts = event context (between filename and entry type)
     middle = parts[1:-1]
     # Strip event names in parentheses for brevity: CE169(リブパイズリ) → CE169
-    cleaned = []
-    for part in middle:
-        paren = part.find("(")
-        cleaned.append(part[:paren] if paren > 0 else part)
-    return "/".join(cleaned)
+    # (a part that *starts* with "(" is kept whole rather than blanked)
+    return "/".join([part.partition("(")[0] or part for part in middle])
@@ -163,7 +163,7 @@ class GlossaryDialog(QDialog):
         self.general_table.setItem(row, 1, QTableWidgetItem(""))
 
     def _remove_general_rows(self):
-        rows = sorted(set(idx.row() for idx in self.general_table.selectedIndexes()), reverse=True)
+        rows = sorted((idx.row() for idx in self.general_table.selectionModel().selectedRows()), reverse=True)
         for row in rows:
             self.general_table.removeRow(row)
 
@@ -187,7 +187,7 @@ class GlossaryDialog(QDialog):
         self.project_table.setItem(row, 1, QTableWidgetItem(""))
 
     def _remove_project_rows(self):
-        rows = sorted(set(idx.row() for idx in self.project_table.selectedIndexes()), reverse=True)
+        rows = sorted((idx.row() for idx in self.project_table.selectionModel().selectedRows()), reverse=True)
         for row in rows:
             self.project_table.removeRow(row)
 
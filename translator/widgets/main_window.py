@@ -2242,7 +2242,7 @@ class MainWindow(QMainWindow):
         # Build set of existing entry IDs to avoid duplicates
         existing_ids = {e.id for e in self.project.entries}
 
-        added = 0
+        added = []
         skipped = 0
         for entry_id, original, translation in accepted:
             if entry_id in existing_ids:
@@ -2258,16 +2258,16 @@ class MainWindow(QMainWindow):
             )
             self.project.entries.append(entry)
             existing_ids.add(entry_id)
-            added += 1
+            added.append(entry)
 
         if added:
             # Invalidate cached index so tree view sees new file
             self.project._build_index()
-            self.trans_table.set_entries(self.project.entries)
+            self.trans_table.append_entries(added)
             self.event_viewer.set_entries(self.project.entries)
             self.file_tree.load_project(self.project)
 
-        msg = f"Imported {added} plugin translations."
+        msg = f"Imported {len(added)} plugin translations."
         if skipped:
             msg += f"\n{skipped} entries skipped (already in project)."
         QMessageBox.information(self, "Scan Plugin Edits", msg)
@@ -3890,6 +3890,7 @@ class MainWindow(QMainWindow):
 
         mode = getattr(self, "_current_batch_mode", "all")
         count = 0
+        table_updates = []
         for e in self.project.entries:
             if e.status != "untranslated":
                 continue
@@ -3901,10 +3902,11 @@ class MainWindow(QMainWindow):
             if stripped in glossary:
                 e.translation = glossary[stripped]
                 e.status = "translated"
-                self.trans_table.update_entry(e.id, e.translation)
+                table_updates.append((e.id, e.translation))
                 self.queue_panel.mark_prefill(e.id, e.translation, "Glossary")
                 self._maybe_add_to_glossary(e)
                 count += 1
+        self.trans_table.update_entries(table_updates)
 
         if count:
             self.file_tree.refresh_stats(self.project)
@@ -4706,8 +4708,7 @@ class MainWindow(QMainWindow):
         elif clicked == view_btn:
             # Filter table to show only mismatch entries
             mismatch_entries = [e for e in self.project.entries if e.id in mismatch_ids]
-            self.trans_table._entries = mismatch_entries
-            self.trans_table._apply_filter()
+            self.trans_table.filter_by_file(mismatch_entries)
             self.file_tree.clearSelection()
             self.statusbar.showMessage(
                 f"Showing {len(mismatch_entries)} entries with glossary mismatches "
@@ -5436,13 +5437,15 @@ class MainWindow(QMainWindow):
         dupe_map = getattr(self, '_batch_dupe_map', {})
         if entry and entry.original in dupe_map:
             dupes = dupe_map[entry.original]
+            table_updates = []
             for dupe in dupes:
                 if dupe.status == "untranslated":
                     dupe.translation = translation
                     dupe.status = "translated"
-                    self.trans_table.update_entry(dupe.id, translation)
+                    table_updates.append((dupe.id, translation))
                     self._maybe_add_to_glossary(dupe)
                     self._dupe_fill_count += 1
+            self.trans_table.update_entries(table_updates)
             # Update progress bar with dupe fills
             effective = self._batch_done_count + self._dupe_fill_count
             self.progress_bar.setValue(effective)
@@ -1,13 +1,15 @@
 """Settings dialog for configuring translation provider and options."""
 
+from functools import lru_cache
+
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
     QLineEdit, QComboBox, QPlainTextEdit, QPushButton,
     QLabel, QGroupBox, QMessageBox, QSpinBox,
-    QCheckBox, QApplication, QProgressDialog, QTabWidget, QWidget,
+    QCheckBox, QProgressDialog, QTabWidget, QWidget,
     QSizePolicy,
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
 
 from ..ai_client import (
     AIClient, SYSTEM_PROMPT, SUGOI_SYSTEM_PROMPT, TYRANO_SYSTEM_PROMPT,
@@ -19,6 +21,29 @@ from ..rpgmaker_mv import RPGMakerMVParser
 from .model_suggestion_dialog import ModelSuggestionDialog
 
 
+# Stripped text of every preset + the TyranoScript prompt, for O(1)
+# "is this still a stock prompt?" checks while the user edits
+_KNOWN_PROMPTS = frozenset(
+    [t.strip() for t in PROMPT_PRESETS.values() if t]
+    + [TYRANO_SYSTEM_PROMPT.strip()]
+)
+
+
+@lru_cache(maxsize=64)
+def _default_prompt(lang: str, model: str, project_type: str) -> str:
+    """Memoized build_system_prompt — keyed on the plain argument tuple."""
+    return build_system_prompt(lang, model=model, project_type=project_type)
+
+
+@lru_cache(maxsize=64)
+def _default_prompt_stripped(lang: str, model: str, project_type: str) -> str:
+    """Stripped variant of _default_prompt, for comparing against the editor."""
+    return _default_prompt(lang, model, project_type).strip()
+
+
+_is_sugoi_cached = lru_cache(maxsize=512)(is_sugoi_model)
+
+
 class _ModelFetcher(QThread):
     """Background thread to fetch model list from Ollama without blocking UI."""
     done = pyqtSignal(list)
@@ -40,6 +65,38 @@ class _ModelFetcher(QThread):
         self.done.emit(models)
 
 
+class _RestartWorker(QThread):
+    """Background thread to restart Ollama without freezing the dialog."""
+    done = pyqtSignal(bool)
+
+    def __init__(self, client, num_parallel):
+        super().__init__()
+        self._client = client
+        self._num_parallel = num_parallel
+
+    def run(self):
+        self.done.emit(self._client.restart_server(self._num_parallel))
+
+
+def _apply_attrs(target, values: dict):
+    """Set each of ``values`` as an attribute on ``target``."""
+    for k, v in values.items():
+        setattr(target, k, v)
+
+
+class _LazyComboBox(QComboBox):
+    """Combo box that announces when its popup is about to open.
+
+    Lets the dialog defer filling the item list until the user actually
+    looks at it.
+    """
+    popup_requested = pyqtSignal()
+
+    def showPopup(self):
+        self.popup_requested.emit()
+        super().showPopup()
+
+
 class SettingsDialog(QDialog):
     """Dialog for configuring translation provider, model, prompt, and options."""
 
@@ -59,6 +116,7 @@ class SettingsDialog(QDialog):
         self.engine = engine
         self.engine_overrides = engine_overrides or {}
         self.engine_handlers = engine_handlers or {}
+        self._models_loaded = False  # Ollama model list fetched on first popup
         self.setWindowTitle("Settings")
         self.setMinimumSize(600, 500)
         self._build_ui()
@@ -118,9 +176,16 @@ class SettingsDialog(QDialog):
 
         # Model
         model_row = QHBoxLayout()
-        self.model_combo = QComboBox()
+        self.model_combo = _LazyComboBox()
+        self.model_combo.popup_requested.connect(self._ensure_models_loaded)
         self.model_combo.setEditable(True)
         self.model_combo.setMinimumWidth(250)
+        # Typed names are read via currentText(), never added as items; a fixed
+        # contents length keeps the size hint from being recomputed per model
+        self.model_combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+        self.model_combo.setSizeAdjustPolicy(
+            QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon)
+        self.model_combo.setMinimumContentsLength(30)
         model_row.addWidget(self.model_combo)
 
         self.refresh_btn = QPushButton("Refresh")
@@ -140,19 +205,28 @@ class SettingsDialog(QDialog):
 
         self.model_hint_label = QLabel("")
         self.model_hint_label.setWordWrap(True)
+        self._last_hint = ("", "")  # (text, stylesheet) last applied
+        self._last_hint_key = None  # (is_sugoi, language) the hint was built for
         form.addRow("", self.model_hint_label)
 
         self.status_label = QLabel("")
         form.addRow("", self.status_label)
 
         self.lang_combo = QComboBox()
-        for name, stars, tip in TARGET_LANGUAGES:
+        for idx, (name, stars, tip) in enumerate(TARGET_LANGUAGES):
             self.lang_combo.addItem(f"{name}  {stars}", userData=name)
-            self.lang_combo.setItemData(self.lang_combo.count() - 1, tip, Qt.ItemDataRole.ToolTipRole)
+            self.lang_combo.setItemData(idx, tip, Qt.ItemDataRole.ToolTipRole)
         self.lang_combo.currentIndexChanged.connect(self._on_language_changed)
         form.addRow("Target Language:", self.lang_combo)
 
-        self.model_combo.currentTextChanged.connect(self._on_model_changed)
+        # Editable combo fires per keystroke — only act on the settled text
+        self._model_change_timer = QTimer(self)
+        self._model_change_timer.setSingleShot(True)
+        self._model_change_timer.setInterval(150)  # 150ms debounce
+        self._model_change_timer.timeout.connect(
+            lambda: self._on_model_changed(self.model_combo.currentText()))
+        self.model_combo.currentTextChanged.connect(
+            lambda _text: self._model_change_timer.start())
 
         self.tabs.addTab(tab, "Provider")
 
@@ -185,11 +259,22 @@ class SettingsDialog(QDialog):
 
         self.prompt_edit = QPlainTextEdit()
         self.prompt_edit.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self._prompt_cache = None  # stripped editor text, reset on every edit
+        self.prompt_edit.textChanged.connect(self._invalidate_prompt_cache)
         self.prompt_edit.textChanged.connect(self._on_prompt_edited)
         vbox.addWidget(self.prompt_edit)
 
         self.tabs.addTab(tab, "Prompt")
 
+    def _invalidate_prompt_cache(self):
+        self._prompt_cache = None
+
+    def _prompt_stripped(self) -> str:
+        """Stripped prompt editor text, cached until the next edit."""
+        if self._prompt_cache is None:
+            self._prompt_cache = self.prompt_edit.toPlainText().strip()
+        return self._prompt_cache
+
     # ── Tab 3: Options ────────────────────────────────────────────────
 
     def _build_options_tab(self):
@@ -465,7 +550,8 @@ class SettingsDialog(QDialog):
             self.engine_table.setCellWidget(row, 3, workers_spin)
 
             # Model selector
-            model_combo = QComboBox()
+            model_combo = _LazyComboBox()
+            model_combo.popup_requested.connect(self._ensure_models_loaded)
             model_combo.addItem("(Use global)")
             model_combo.setToolTip(
                 "Model to use for this engine.\n"
@@ -605,6 +691,11 @@ class SettingsDialog(QDialog):
 
         # Apply provider visibility and fetch models
         self._on_provider_changed(self.client.provider)
+        # Run any pending debounced model change now, while still loading,
+        # so it can't auto-set batch size after load finishes
+        if self._model_change_timer.isActive():
+            self._model_change_timer.stop()
+            self._on_model_changed(self.model_combo.currentText())
         self._loading = False
 
     # ── Provider / Prompt preset handlers ─────────────────────────────
@@ -633,26 +724,21 @@ class SettingsDialog(QDialog):
         if is_cloud and not is_custom:
             models = PROVIDER_MODELS.get(provider, [])
             current = self.model_combo.currentText()
-            self.model_combo.blockSignals(True)
-            self.model_combo.clear()
-            for m in models:
-                self.model_combo.addItem(m)
             # Keep current if it's in the new list, else pick first
-            if current in models:
-                self.model_combo.setCurrentText(current)
-            self.model_combo.blockSignals(False)
+            self._populate_models(models, current if current in models else None)
             self.status_label.setText(f"{provider}: {len(models)} model(s) available")
             self.status_label.setStyleSheet("color: #89b4fa;")
         elif is_ollama:
-            # Fetch models from Ollama in background
-            self._model_fetcher = _ModelFetcher(
-                self.client,
-                self.url_edit.text().strip() or "http://localhost:11434",
-            )
-            self._model_fetcher.done.connect(self._on_models_fetched)
-            self.status_label.setText("Fetching models...")
-            self.status_label.setStyleSheet("")
-            self._model_fetcher.start()
+            if self._loading:
+                # Seed with the saved model only — the full list is fetched
+                # the first time a model dropdown is opened
+                self._models_loaded = False
+                seed = [self.client.model] if self.client.model else []
+                self._populate_models(seed, self.client.model)
+            else:
+                # Fetch models from Ollama in background
+                self._refresh_models()
+                self.status_label.setStyleSheet("")
 
         # Auto-set batch size and workers based on provider/model (DazedMTL defaults)
         # Skip during initial load — saved values should be preserved
@@ -687,7 +773,7 @@ class SettingsDialog(QDialog):
             return
         # Check if the text still matches the preset
         preset_text = PROMPT_PRESETS.get(current_preset, "")
-        if preset_text and self.prompt_edit.toPlainText().strip() != preset_text.strip():
+        if preset_text and self._prompt_stripped() != preset_text.strip():
             self._suppress_preset_change = True
             idx = self.prompt_preset_combo.findText("Custom")
             if idx >= 0:
@@ -699,13 +785,13 @@ class SettingsDialog(QDialog):
         """Reset prompt to the recommended default for the current model/language."""
         model = self.model_combo.currentText()
         lang = self.lang_combo.currentData() or "English"
-        default_prompt = build_system_prompt(lang, model=model,
-                                            project_type=self.client.project_type)
+        default_prompt = _default_prompt(lang, model, self.client.project_type)
+        default_stripped = _default_prompt_stripped(lang, model, self.client.project_type)
         self._suppress_preset_change = True
         self.prompt_edit.setPlainText(default_prompt)
         # Match the prompt to the correct preset name
         for name, text in PROMPT_PRESETS.items():
-            if text and text.strip() == default_prompt.strip():
+            if text and text.strip() == default_stripped:
                 idx = self.prompt_preset_combo.findText(name)
                 if idx >= 0:
                     self.prompt_preset_combo.setCurrentIndex(idx)
@@ -728,9 +814,9 @@ class SettingsDialog(QDialog):
         if self._loading:
             return  # Don't override saved values during initial load
         enabled = state == Qt.CheckState.Checked.value
+        provider = self.provider_combo.currentText()
         if enabled:
             self.batch_spin.setValue(30)
-            provider = self.provider_combo.currentText()
             if provider == "Ollama (Local)":
                 self.workers_spin.setValue(LOCAL_DEFAULT_WORKERS)
             else:
@@ -746,7 +832,6 @@ class SettingsDialog(QDialog):
             self._suppress_preset_change = False
         else:
             # Restore defaults based on current provider
-            provider = self.provider_combo.currentText()
             if provider == "Ollama (Local)":
                 self.batch_spin.setValue(5)
                 self.workers_spin.setValue(LOCAL_DEFAULT_WORKERS)
@@ -768,36 +853,51 @@ class SettingsDialog(QDialog):
     def _populate_model_combo(self, models: list):
         """Populate the model combo from an already-fetched model list."""
         current = self.model_combo.currentText()
-        self.model_combo.blockSignals(True)
-        self.model_combo.clear()
         if models:
             sugoi = sorted(m for m in models if is_sugoi_model(m))
             others = sorted(m for m in models if not is_sugoi_model(m))
-            for m in sugoi:
-                self.model_combo.addItem(m)
-                idx = self.model_combo.count() - 1
-                self.model_combo.setItemData(
-                    idx, "Recommended for JP\u2192EN (Sugoi \u2014 VN/RPG specialized)",
-                    Qt.ItemDataRole.ToolTipRole,
-                )
-            for m in others:
-                self.model_combo.addItem(m)
-            if current in models:
-                self.model_combo.setCurrentText(current)
+            self._populate_models(
+                sugoi + others, current if current in models else None,
+                tooltip_count=len(sugoi),
+                tooltip="Recommended for JP\u2192EN (Sugoi \u2014 VN/RPG specialized)",
+            )
             self.status_label.setText(f"Found {len(models)} model(s)")
             self.status_label.setStyleSheet("color: green;")
         else:
-            self.model_combo.setCurrentText(current)
+            self._populate_models([], current)
             self.status_label.setText("Could not fetch models -- is Ollama running?")
             self.status_label.setStyleSheet("color: red;")
-        self.model_combo.blockSignals(False)
         # Only trigger model-changed if the model actually changed
         new_model = self.model_combo.currentText()
         if new_model != current:
             self._on_model_changed(new_model)
 
+    def _populate_models(self, models: list, select: str = None,
+                         tooltip_count: int = 0, tooltip: str = ""):
+        """Replace the model combo items in one batch.
+
+        Signals stay blocked for the whole rebuild, so no per-item
+        ``currentTextChanged`` fires — callers decide whether to run
+        ``_on_model_changed`` afterwards.  The first ``tooltip_count``
+        items get ``tooltip`` attached.
+        """
+        self.model_combo.blockSignals(True)
+        self.model_combo.clear()
+        self.model_combo.addItems(models)
+        for idx in range(tooltip_count):
+            self.model_combo.setItemData(idx, tooltip, Qt.ItemDataRole.ToolTipRole)
+        if select is not None:
+            self.model_combo.setCurrentText(select)
+        self.model_combo.blockSignals(False)
+
+    def _ensure_models_loaded(self):
+        """Fetch the Ollama model list the first time a model dropdown opens."""
+        if not self._models_loaded and self.provider_combo.currentText() == "Ollama (Local)":
+            self._refresh_models()
+
     def _refresh_models(self):
         """Fetch available models from Ollama (used by Refresh button)."""
+        self._models_loaded = True
         self._model_fetcher = _ModelFetcher(
             self.client,
             self.url_edit.text().strip() or "http://localhost:11434",
@@ -851,6 +951,11 @@ class SettingsDialog(QDialog):
 
     def _suggest_model(self):
         """Show GPU-aware model recommendation dialog."""
+        if not self._models_loaded and self.provider_combo.currentText() == "Ollama (Local)":
+            # Installed list not fetched yet — open the dialog once it arrives
+            self._refresh_models()
+            self._model_fetcher.done.connect(lambda _models: self._suggest_model())
+            return
         # Get currently installed models
         installed = []
         for i in range(self.model_combo.count()):
@@ -868,9 +973,12 @@ class SettingsDialog(QDialog):
             if tag.lower() in self.model_combo.itemText(i).lower():
                 self.model_combo.setCurrentIndex(i)
                 return
-        # Not in combo — add it and select
-        self.model_combo.addItem(tag)
-        self.model_combo.setCurrentText(tag)
+        # Not in combo — rebuild once with the tag appended, then select it
+        current = self.model_combo.currentText()
+        installed = [self.model_combo.itemText(i) for i in range(self.model_combo.count())]
+        self._populate_models(installed + [tag], tag)
+        if tag != current:
+            self._on_model_changed(tag)
         # Refresh model list to pick up newly pulled models
         self._refresh_models()
 
@@ -883,36 +991,39 @@ class SettingsDialog(QDialog):
             return
         old_lang = self._orig_language
         current_model = self.model_combo.currentText()
-        current_prompt = self.prompt_edit.toPlainText().strip()
+        current_prompt = self._prompt_stripped()
         ptype = self.client.project_type
-        old_prompt = build_system_prompt(old_lang, model=current_model, project_type=ptype)
-        if current_prompt == old_prompt.strip():
-            self.prompt_edit.setPlainText(build_system_prompt(new_lang, model=current_model,
-                                                              project_type=ptype))
+        if current_prompt == _default_prompt_stripped(old_lang, current_model, ptype):
+            self.prompt_edit.setPlainText(_default_prompt(new_lang, current_model, ptype))
             self._orig_language = new_lang
 
     def _on_model_changed(self, model_name: str):
         """Auto-update system prompt, hint label, and batch size when model changes."""
         current_lang = self.lang_combo.currentData() or "English"
-        current_prompt = self.prompt_edit.toPlainText().strip()
+        current_prompt = self._prompt_stripped()
+        ptype = self.client.project_type
 
-        if is_sugoi_model(model_name):
-            if current_lang in ("English", "Pig Latin"):
-                self.model_hint_label.setText(
-                    "Sugoi detected \u2014 DazedMTL Full prompt recommended (click Reset Default)"
-                )
-                self.model_hint_label.setStyleSheet("color: #a6e3a1;")
+        # Hint only depends on the model class + language — skip if unchanged
+        is_sugoi = _is_sugoi_cached(model_name)
+        hint_key = (is_sugoi, current_lang)
+        if hint_key != self._last_hint_key:
+            self._last_hint_key = hint_key
+            if is_sugoi:
+                if current_lang in ("English", "Pig Latin"):
+                    self._set_model_hint(
+                        "Sugoi detected \u2014 DazedMTL Full prompt recommended (click Reset Default)",
+                        "color: #a6e3a1;",
+                    )
+                else:
+                    self._set_model_hint(
+                        "Sugoi is JP\u2192EN only \u2014 using general prompt for " + current_lang,
+                        "color: #fab387;",
+                    )
             else:
-                self.model_hint_label.setText(
-                    "Sugoi is JP\u2192EN only \u2014 using general prompt for " + current_lang
-                )
-                self.model_hint_label.setStyleSheet("color: #fab387;")
-        else:
-            self.model_hint_label.setText("")
+                self._set_model_hint("")
 
-        if self._is_known_prompt_template(current_prompt):
-            new_prompt = build_system_prompt(current_lang, model=model_name,
-                                            project_type=self.client.project_type)
+        if self._is_known_prompt_template(current_prompt, current_lang):
+            new_prompt = _default_prompt(current_lang, model_name, ptype)
             self.prompt_edit.setPlainText(new_prompt)
 
         # Auto-set batch size from model config (cloud providers only)
@@ -925,18 +1036,34 @@ class SettingsDialog(QDialog):
                 if batch != self.batch_spin.value():
                     self.batch_spin.setValue(batch)
 
-    def _is_known_prompt_template(self, prompt: str) -> bool:
-        """Check if the prompt matches any known preset or auto-generated template."""
+    def _set_model_hint(self, text: str, style: str = None):
+        """Update the model hint label, skipping Qt calls when nothing changed.
+
+        ``style=None`` keeps the current stylesheet.
+        """
+        last_text, last_style = self._last_hint
+        if style is None:
+            style = last_style
+        if (text, style) == self._last_hint:
+            return
+        if text != last_text:
+            self.model_hint_label.setText(text)
+        if style != last_style:
+            self.model_hint_label.setStyleSheet(style)
+        self._last_hint = (text, style)
+
+    def _is_known_prompt_template(self, prompt: str, lang: str = None) -> bool:
+        """Check if the prompt matches any known preset or auto-generated template.
+
+        ``lang`` lets callers that already read the language combo pass it in.
+        """
         p = prompt.strip()
-        # Check all presets
-        for name, text in PROMPT_PRESETS.items():
-            if text and p == text.strip():
-                return True
-        # Check TyranoScript prompt
-        if p == TYRANO_SYSTEM_PROMPT.strip():
+        # Presets and TyranoScript prompt
+        if p in _KNOWN_PROMPTS:
             return True
-        return p == build_system_prompt(self.lang_combo.currentData() or "English",
-                                       project_type=self.client.project_type).strip()
+        if lang is None:
+            lang = self.lang_combo.currentData() or "English"
+        return p == _default_prompt_stripped(lang, "", self.client.project_type)
 
     # ── Save / Cancel ────────────────────────────────────────────────
 
@@ -951,25 +1078,40 @@ class SettingsDialog(QDialog):
 
     def _save(self):
         """Apply settings and close."""
-        self.client.provider = self.provider_combo.currentText()
-        self.client.api_key = self.api_key_edit.text().strip()
-        self.client.base_url = self.url_edit.text().strip() or "http://localhost:11434"
-        self.client.model = self.model_combo.currentText().strip()
-        self.client.system_prompt = self.prompt_edit.toPlainText().strip() or SYSTEM_PROMPT
-        self.client._prompt_preset = self.prompt_preset_combo.currentText()
-        self.client.target_language = self.lang_combo.currentData() or "English"
+        # A model picked just before OK may still be waiting on the debounce —
+        # apply its prompt/batch-size defaults before they are read below
+        if self._model_change_timer.isActive():
+            self._model_change_timer.stop()
+            self._on_model_changed(self.model_combo.currentText())
+        _apply_attrs(self.client, {
+            "provider": self.provider_combo.currentText(),
+            "api_key": self.api_key_edit.text().strip(),
+            "base_url": self.url_edit.text().strip() or "http://localhost:11434",
+            "model": self.model_combo.currentText().strip(),
+            "system_prompt": self._prompt_stripped() or SYSTEM_PROMPT,
+            "_prompt_preset": self.prompt_preset_combo.currentText(),
+            "target_language": self.lang_combo.currentData() or "English",
+            "dazed_mode": self.dazed_mode_check.isChecked(),
+        })
         # Vision model removed — main model handles image OCR
         if self.parser:
-            self.parser.context_size = self.context_spin.value()
+            _apply_attrs(self.parser, {
+                "context_size": self.context_spin.value(),
+                "extract_script_strings": self.script_strings_check.isChecked(),
+                "extract_comments": self.extract_comments_check.isChecked(),
+                "single_401_mode": self.single_401_check.isChecked(),
+                "speaker_processing": self.speaker_processing_check.isChecked(),
+            })
 
         new_workers = self.workers_spin.value()
         if self.engine:
-            self.engine.num_workers = new_workers
-            self.engine.batch_size = self.batch_spin.value()
-            self.engine.max_history = self.history_spin.value()
+            _apply_attrs(self.engine, {
+                "num_workers": new_workers,
+                "batch_size": self.batch_spin.value(),
+                "max_history": self.history_spin.value(),
+            })
 
-        if new_workers != self._orig_workers and not self.client.is_cloud:
-            self._restart_ollama(new_workers)
+        restart_workers = new_workers != self._orig_workers and not self.client.is_cloud
 
         if self.plugin_analyzer:
             manual = self.wordwrap_spin.value()
@@ -991,12 +1133,6 @@ class SettingsDialog(QDialog):
         font_names = ["Consolas", "M+ 1m", "Arial", "Courier New", None]
         idx = self.font_combo.currentIndex()
         self.game_font = font_names[idx] if idx < len(font_names) else "Consolas"
-        self.client.dazed_mode = self.dazed_mode_check.isChecked()
-        if self.parser:
-            self.parser.extract_script_strings = self.script_strings_check.isChecked()
-            self.parser.extract_comments = self.extract_comments_check.isChecked()
-            self.parser.single_401_mode = self.single_401_check.isChecked()
-            self.parser.speaker_processing = self.speaker_processing_check.isChecked()
         # Save per-engine overrides from the Engines tab
         # Sync main wordwrap spinner to the active engine's override
         ww_val = self.wordwrap_spin.value() if self.plugin_analyzer else 0
@@ -1022,7 +1158,10 @@ class SettingsDialog(QDialog):
             if model and model != "(Use global)":
                 override["model"] = model
             self.engine_overrides[key] = override
-        self.accept()
+        if restart_workers:
+            self._restart_ollama(new_workers)  # accepts once the restart finishes
+        else:
+            self.accept()
 
     def _on_ww_spin_changed(self, value: int):
         """Update suffix when wordwrap spinner changes."""
@@ -1041,11 +1180,16 @@ class SettingsDialog(QDialog):
         progress.setWindowTitle("Restarting Ollama")
         progress.setMinimumDuration(0)
         progress.setCancelButton(None)
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
         progress.show()
-        QApplication.processEvents()
 
-        ok = self.client.restart_server(num_parallel)
+        self._restart_worker = _RestartWorker(self.client, num_parallel)
+        self._restart_worker.done.connect(
+            lambda ok: self._on_restart_done(ok, num_parallel, progress))
+        self._restart_worker.start()
 
+    def _on_restart_done(self, ok: bool, num_parallel: int, progress: QProgressDialog):
+        """Report the Ollama restart result and close the dialog."""
         progress.close()
 
         if ok:
@@ -1063,6 +1207,7 @@ class SettingsDialog(QDialog):
                 f"  2. set OLLAMA_NUM_PARALLEL={num_parallel}\n"
                 f"  3. ollama serve",
             )
+        self.accept()
 
     def get_system_prompt(self) -> str:
         return self.prompt_edit.toPlainText()
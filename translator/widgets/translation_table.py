@@ -5,6 +5,10 @@ rows are rendered, so 24k+ entries load instantly.
 """
 
 import re
+import sys
+from bisect import bisect_right
+from functools import partial
+from operator import attrgetter, is_
 
 from ..utils import event_prefix, extract_event_context
 from .spell_checker import SpellHighlighter, build_spell_menu_actions
@@ -19,15 +23,47 @@ from PyQt6.QtCore import (
     pyqtSignal, Qt, QTimer, QAbstractTableModel, QModelIndex,
 )
 from PyQt6.QtGui import (
-    QColor, QAction, QTextCursor, QShortcut, QKeySequence, QKeyEvent,
+    QBrush, QColor, QAction, QTextCursor, QShortcut, QKeySequence, QKeyEvent,
 )
 
 from ..project_model import TranslationEntry
 from .. import CONTROL_CODE_RE, JAPANESE_RE
 
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
 _CODE_RE = CONTROL_CODE_RE  # local alias
+_CODE_SUB = _CODE_RE.sub  # bound once for the per-entry search/stat paths
+_CODE_FINDALL = _CODE_RE.findall
+_get_status = attrgetter("status")
 _JAPANESE_RE = JAPANESE_RE
 
+# "[Speaker: Name]" tag in entry.context — group 1 is the name
+_SPEAKER_RE = re.compile(r'\[Speaker:\s*(.+?)\]')
+_SPEAKER_TAG = "[Speaker:"  # plain substring probe for "has any speaker"
+# Speaker tag heading a context line (as written by event parsers)
+_SPEAKER_LINE_RE = re.compile(r'^\[Speaker:\s*(.+?)\]', re.MULTILINE)
+# Whole tag plus its trailing newline, for removal
+_SPEAKER_STRIP_RE = re.compile(r'\[Speaker:\s*.+?\]\n?')
+
+# Item roles bound once — data() runs per cell per role on every repaint
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_EDIT_ROLE = Qt.ItemDataRole.EditRole
+_TOOLTIP_ROLE = Qt.ItemDataRole.ToolTipRole
+_BACKGROUND_ROLE = Qt.ItemDataRole.BackgroundRole
+_ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+# Roles data() answers; everything else is None
+_DATA_ROLES = frozenset((
+    _DISPLAY_ROLE, _EDIT_ROLE, _TOOLTIP_ROLE, _BACKGROUND_ROLE, _ALIGNMENT_ROLE,
+))
+# Roles an entry edit can change — passed with dataChanged so the view
+# doesn't re-query alignment/tooltip/etc. for every cell
+_EDITED_ROLES = [_DISPLAY_ROLE, _EDIT_ROLE, _BACKGROUND_ROLE]
+
 
 # Status colors — light mode
 STATUS_COLORS_LIGHT = {
@@ -45,6 +81,12 @@ STATUS_COLORS_DARK = {
     "skipped":      QColor(50, 50, 55),      # dark gray
 }
 
+# BackgroundRole is painted as a QBrush — hand the delegate shared brushes
+# instead of a QColor it has to wrap per cell per paint
+_STATUS_BRUSHES_LIGHT = {k: QBrush(v) for k, v in STATUS_COLORS_LIGHT.items()}
+_STATUS_BRUSHES_DARK = {k: QBrush(v) for k, v in STATUS_COLORS_DARK.items()}
+_WHITE = QBrush(QColor(255, 255, 255))  # fallback background for unknown statuses
+
 STATUS_ICONS = {
     "untranslated": "\u25cb",  # ○
     "translated":   "\u25d0",  # ◐
@@ -62,6 +104,94 @@ COL_TRANSLATION = 4
 _COLUMN_HEADERS = ["", "File", "Event", "Original (JP)", "Translation (EN)"]
 
 
+def _all_terms_matcher(terms: list[str]):
+    """Return ``blob -> bool`` that is True when every term occurs in *blob*.
+
+    Multi-term ("+" AND) queries use a single Aho-Corasick pass per blob
+    when pyahocorasick is installed; otherwise one substring scan per term.
+    """
+    terms = list(dict.fromkeys(terms))  # dedupe — automaton keys are unique
+    if HAS_AHOCORASICK and len(terms) > 1:
+        automaton = ahocorasick.Automaton()
+        for i, t in enumerate(terms):
+            automaton.add_word(t, i)
+        automaton.make_automaton()
+        full = (1 << len(terms)) - 1
+
+        def match(blob: str) -> bool:
+            seen = 0
+            for _end, i in automaton.iter(blob):
+                seen |= 1 << i
+                if seen == full:
+                    return True
+            return False
+        return match
+    return lambda blob: all(t in blob for t in terms)
+
+
+# Pronoun swap word maps (lowercase; matched case-insensitively, and a
+# Capitalized match gets a Capitalized replacement).  Every word is swapped
+# in one pass of a single alternation; "her"/"his" are possessive before a
+# lowercase word and map to (possessive, other) forms.
+_F2M_WORDS = {
+    "herself": "himself", "hers": "his", "she's": "he's", "she": "he",
+    # Gendered nouns
+    "girls": "guys", "girl": "guy", "woman": "man", "women": "men",
+    "lady": "gentleman", "mother": "father", "sister": "brother",
+    "daughter": "son", "wife": "husband", "heroine": "hero",
+}
+_F2M_POSSESSIVE = {"her": ("his", "him")}
+
+_M2F_WORDS = {
+    "himself": "herself", "he's": "she's", "him": "her", "he": "she",
+    # Gendered nouns
+    "guys": "girls", "guy": "girl", "men": "women", "man": "woman",
+    "gentleman": "lady", "father": "mother", "brother": "sister",
+    "son": "daughter", "husband": "wife", "hero": "heroine",
+}
+_M2F_POSSESSIVE = {"his": ("her", "hers")}
+
+
+def _pronoun_swapper(words: dict, possessive: dict):
+    """Build a text -> text swap doing one regex pass over *words* + *possessive*."""
+    # Longest first so e.g. "herself" wins over "her"; the lookahead group
+    # is set when a lowercase word follows (without consuming it)
+    alts = "|".join(re.escape(w) for w in sorted(
+        (*words, *possessive), key=len, reverse=True))
+    # Not re.ASCII: \s must still see U+3000/NBSP and \b must not split
+    # CJK from Latin — Japanese-game text mixes both.  f2m "her\u3000book"
+    # -> "his\u3000book", m2f "his\u3000sword" -> "her\u3000sword", and
+    # "彼女her" is left alone, as with the original per-word substitutions.
+    pattern = re.compile(
+        r"\b(?:" + alts + r")\b(?=(\s+(?-i:[a-z]))?)", re.IGNORECASE)
+
+    def repl(m):
+        word = m.group(0)
+        key = word.lower()
+        if key not in words and key not in possessive:
+            return word  # Unicode case-fold hit (e.g. long s for "s") — not a listed word
+        if word == key:
+            capital = False
+        elif word == key.capitalize():
+            capital = True
+        else:
+            return word  # ALL CAPS / mixed case is left alone
+        forms = possessive.get(key)
+        if forms is None:
+            swapped = words[key]
+        else:
+            swapped = forms[0] if m.group(1) else forms[1]
+        return swapped.capitalize() if capital else swapped
+
+    return partial(pattern.sub, repl)
+
+
+_PRONOUN_SWAPS = {
+    "f2m": _pronoun_swapper(_F2M_WORDS, _F2M_POSSESSIVE),  # she/her → he/him
+    "m2f": _pronoun_swapper(_M2F_WORDS, _M2F_POSSESSIVE),  # he/him → she/her
+}
+
+
 # Backward-compatible alias — shared implementation in translator.utils
 _extract_event_context = extract_event_context
 
@@ -69,21 +199,47 @@ _extract_event_context = extract_event_context
 class TranslationTableModel(QAbstractTableModel):
     """Model backing the translation table — provides data on demand."""
 
+    translation_edited = pyqtSignal(int, bool)  # row, status changed — inline edits only
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._entries: list[TranslationEntry] = []
+        self._field_labels: list[str | None] = []  # COL_FIELD text, filled on first paint
+        self._id_to_row: dict[str, int] | None = None  # built on first row_for_id()
+        self._event_ctx: dict[str, str] = {}  # entry.id → event context; ids never change
         self._dark_mode = True
+        self._status_brushes = _STATUS_BRUSHES_DARK  # palette for the current mode
 
-    @property
-    def _status_colors(self):
-        return STATUS_COLORS_DARK if self._dark_mode else STATUS_COLORS_LIGHT
+    def set_dark_mode(self, dark: bool):
+        """Switch the background palette; the view repaints on its next update."""
+        self._dark_mode = dark
+        self._status_brushes = _STATUS_BRUSHES_DARK if dark else _STATUS_BRUSHES_LIGHT
 
     def set_entries(self, entries: list, dupe_counts: dict = None):
         self.beginResetModel()
         self._entries = entries
         self._dupe_counts = dupe_counts or {}
+        self._field_labels = [None] * len(entries)
+        self._id_to_row = None
         self.endResetModel()
 
+    def append_entries(self, entries: list):
+        """Insert *entries* after the last row without resetting the view.
+
+        Unlike set_entries(), selection and scroll position are kept and only
+        the new rows are laid out.
+        """
+        if not entries:
+            return
+        first = len(self._entries)
+        self.beginInsertRows(QModelIndex(), first, first + len(entries) - 1)
+        self._entries.extend(entries)
+        self._field_labels.extend([None] * len(entries))
+        if self._id_to_row is not None:
+            for row, e in enumerate(entries, first):
+                self._id_to_row[e.id] = row
+        self.endInsertRows()
+
     def rowCount(self, parent=QModelIndex()):
         return len(self._entries)
 
@@ -91,43 +247,51 @@ class TranslationTableModel(QAbstractTableModel):
         return 5
 
     def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
-        if not index.isValid():
+        # Most roles Qt probes per cell (font, size hint, decoration, ...) are
+        # unused — answer those before touching the index
+        if role not in _DATA_ROLES or not index.isValid():
             return None
         row, col = index.row(), index.column()
-        if row < 0 or row >= len(self._entries):
-            return None
+        entry = self._entries[row]  # valid indexes are within rowCount()
 
-        entry = self._entries[row]
+        if role == _DISPLAY_ROLE or role == _EDIT_ROLE:
+            return self._DISPLAY_GETTERS[col](self, row, entry)
 
-        if role == Qt.ItemDataRole.DisplayRole or role == Qt.ItemDataRole.EditRole:
-            if col == COL_STATUS:
-                return STATUS_ICONS.get(entry.status, "")
-            elif col == COL_FILE:
-                return entry.file
-            elif col == COL_FIELD:
-                label = _extract_event_context(entry.id)
-                count = self._dupe_counts.get(entry.original, 0)
-                if count > 1:
-                    label = f"{label} (\u00d7{count})"
-                return label
-            elif col == COL_ORIGINAL:
-                return entry.original
-            elif col == COL_TRANSLATION:
-                return entry.translation
-
-        elif role == Qt.ItemDataRole.ToolTipRole:
+        elif role == _TOOLTIP_ROLE:
             if col == COL_FIELD:
                 return f"{entry.field} — {entry.id}"
 
-        elif role == Qt.ItemDataRole.BackgroundRole:
-            return self._status_colors.get(entry.status, QColor(255, 255, 255))
+        elif role == _BACKGROUND_ROLE:
+            return self._status_brushes.get(entry.status, _WHITE)
 
-        elif role == Qt.ItemDataRole.TextAlignmentRole:
+        elif role == _ALIGNMENT_ROLE:
             if col == COL_STATUS:
-                return Qt.AlignmentFlag.AlignCenter
+                return _ALIGN_CENTER
 
         return None
 
+    def _field_label(self, row: int, entry: TranslationEntry) -> str:
+        """Event label for COL_FIELD (plus master-view dupe count), cached per row."""
+        label = self._field_labels[row]
+        if label is None:
+            label = self._event_ctx.get(entry.id)
+            if label is None:
+                label = self._event_ctx[entry.id] = _extract_event_context(entry.id)
+            count = self._dupe_counts.get(entry.original, 0)
+            if count > 1:
+                label = f"{label} (\u00d7{count})"
+            self._field_labels[row] = label
+        return label
+
+    # DisplayRole getters indexed by column: (model, row, entry) -> value
+    _DISPLAY_GETTERS = (
+        lambda self, row, e: STATUS_ICONS.get(e.status, ""),  # COL_STATUS
+        lambda self, row, e: e.file,                          # COL_FILE
+        _field_label,                                         # COL_FIELD
+        lambda self, row, e: e.original,                      # COL_ORIGINAL
+        lambda self, row, e: e.translation,                   # COL_TRANSLATION
+    )
+
     def setData(self, index: QModelIndex, value, role=Qt.ItemDataRole.EditRole):
         if not index.isValid() or role != Qt.ItemDataRole.EditRole:
             return False
@@ -137,16 +301,18 @@ class TranslationTableModel(QAbstractTableModel):
 
         entry = self._entries[row]
         new_text = str(value)
+        old_status = entry.status
         entry.translation = new_text
         if not new_text.strip():
             entry.status = "untranslated"
         elif entry.status not in ("translated", "reviewed"):
             entry.status = "translated"
-        self._last_inline_edit_row = row
         # Emit change for the entire row (status icon + colors changed too)
         self.dataChanged.emit(
-            self.index(row, 0), self.index(row, self.columnCount() - 1)
+            self.index(row, 0), self.index(row, self.columnCount() - 1),
+            _EDITED_ROLES,
         )
+        self.translation_edited.emit(row, entry.status != old_status)
         return True
 
     def flags(self, index: QModelIndex):
@@ -167,11 +333,34 @@ class TranslationTableModel(QAbstractTableModel):
             return self._entries[row]
         return None
 
-    def refresh_row(self, row: int):
-        """Notify the view that a row's data changed."""
+    def row_for_id(self, entry_id: str) -> int | None:
+        """Row of the entry with *entry_id*, or None if it isn't shown."""
+        if self._id_to_row is None:
+            self._id_to_row = {e.id: row for row, e in enumerate(self._entries)}
+        return self._id_to_row.get(entry_id)
+
+    def refresh_row(self, row: int, first_col: int = 0, last_col: int | None = None):
+        """Notify the view that a row's data changed (optionally only some columns)."""
         if 0 <= row < len(self._entries):
+            if last_col is None:
+                last_col = self.columnCount() - 1
+            self.dataChanged.emit(
+                self.index(row, first_col), self.index(row, last_col), _EDITED_ROLES
+            )
+
+    def refresh_span(self, rows):
+        """One dataChanged spanning min(rows)..max(rows).
+
+        For scattered rows updated together: the view only repaints the
+        visible part of the span, and listeners get a single notification.
+        """
+        n = len(self._entries)
+        rows = [r for r in rows if 0 <= r < n]
+        if rows:
             self.dataChanged.emit(
-                self.index(row, 0), self.index(row, self.columnCount() - 1)
+                self.index(min(rows), 0),
+                self.index(max(rows), self.columnCount() - 1),
+                _EDITED_ROLES,
             )
 
     def refresh_all(self):
@@ -180,6 +369,7 @@ class TranslationTableModel(QAbstractTableModel):
             self.dataChanged.emit(
                 self.index(0, 0),
                 self.index(len(self._entries) - 1, self.columnCount() - 1),
+                _EDITED_ROLES,
             )
 
 
@@ -196,16 +386,46 @@ class TranslationTable(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._all_entries = []      # full project (never file-filtered)
+        self._id_to_entry: dict[str, TranslationEntry] = {}  # over _all_entries
+        self._event_index: dict[str, list] | None = None  # built by _event_entries()
+        self._context_speakers: set[str] = set()  # names in the speaker filter
+        self._actor_name_entries = []  # Actors.json name entries (speaker suggestions)
         self._entries = []           # current file-filtered subset (or all)
         self._visible_entries = []   # after search + status filter
         self._dupe_counts = {}       # original_text -> count (master view)
         self._id_filter: set[str] | None = None  # Pinned IDs (overrides other filters)
         self._dark_mode = True  # Match main_window default
         self._speaker_lookup = {}  # JP→EN speaker name lookup
+        self._search_cache = {}  # entry.id -> (original, translation, search blob)
+        self._jp_cache = {}      # entry.id -> (translation, contains Japanese)
+        self._codes_cache = {}   # entry.id -> (original, control codes in it)
+        self._swap_done = {}     # entry.id -> (direction, translation after swap)
+        # Last filter run, for narrowing while the search query grows:
+        # (filter state, query, matched entries before master collapse, source list)
+        self._narrow_base = None
+        self._narrow_search = False  # set by the debounce timer slot
+        self._data_version = 0  # bumped on entry edits — stale hits can't be narrowed
+        self._last_filter_sig = None  # inputs of the last _apply_filter run
+        self._last_filter_src = (None, None)  # (_id_filter, _entries) objects it ran on
+        self._stats_cache = None  # (visible list, len, data version, counts)
         self._filter_timer = QTimer(self)
         self._filter_timer.setSingleShot(True)
-        self._filter_timer.setInterval(250)  # 250ms debounce
-        self._filter_timer.timeout.connect(self._apply_filter)
+        self._filter_timer.setInterval(250)  # 250ms debounce (typing)
+        self._filter_timer.timeout.connect(self._apply_search_filter)
+        # Editor keystrokes store text immediately but repaint the row at
+        # most every 50ms
+        self._editor_refresh_id = None  # entry.id awaiting its row refresh
+        self._editor_refresh_full = False  # its status changed too (whole row)
+        self._editor_refresh_timer = QTimer(self)
+        self._editor_refresh_timer.setSingleShot(True)
+        self._editor_refresh_timer.setInterval(50)
+        self._editor_refresh_timer.timeout.connect(self._flush_editor_refresh)
+        # update_entry() calls (one per LLM result) repaint once per event-loop tick
+        self._pending_update_ids: set[str] = set()
+        self._update_flush_timer = QTimer(self)
+        self._update_flush_timer.setSingleShot(True)
+        self._update_flush_timer.setInterval(0)
+        self._update_flush_timer.timeout.connect(self._flush_entry_updates)
         self._build_ui()
 
     def _build_ui(self):
@@ -258,13 +478,13 @@ class TranslationTable(QWidget):
 
         self.jp_check = QCheckBox("JP in translation")
         self.jp_check.setToolTip("Show only entries where the translation still contains Japanese characters")
-        self.jp_check.stateChanged.connect(self._apply_filter)
+        self.jp_check.stateChanged.connect(self._schedule_toggle_filter)
         filter_row.addWidget(self.jp_check)
 
         self.master_check = QCheckBox("Master View")
         self.master_check.setToolTip(
             "Show each unique text once. Edits propagate to all duplicates.")
-        self.master_check.stateChanged.connect(self._apply_filter)
+        self.master_check.stateChanged.connect(self._schedule_toggle_filter)
         filter_row.addWidget(self.master_check)
 
         layout.addLayout(filter_row)
@@ -310,6 +530,9 @@ class TranslationTable(QWidget):
 
         # Track position for one-by-one replacement
         self._replace_index = 0
+        self._match_indices: list[int] = []  # _all_entries indices matching Find
+        self._match_key = None  # inputs _match_indices was built from
+        self._match_src = None  # the _all_entries list it indexes (compared by identity)
 
         # ── Vertical splitter: table on top, editor on bottom ─────
         vsplit = QSplitter(Qt.Orientation.Vertical)
@@ -322,14 +545,23 @@ class TranslationTable(QWidget):
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self._show_context_menu)
-        self.table.setWordWrap(True)
+        self._ctx_menu = self._build_context_menu()
+        # Single-line rows at a fixed height keep scrolling O(visible rows);
+        # full text is in the editor pane below.
+        self.table.setWordWrap(False)
+        self.table.setTextElideMode(Qt.TextElideMode.ElideRight)
+        vheader = self.table.verticalHeader()
+        vheader.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vheader.setDefaultSectionSize(24)
 
         # Column widths
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(COL_STATUS, QHeaderView.ResizeMode.Fixed)
         self.table.setColumnWidth(COL_STATUS, 30)
-        header.setSectionResizeMode(COL_FILE, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(COL_FIELD, QHeaderView.ResizeMode.ResizeToContents)
+        # Interactive, sized once per project load in set_entries() —
+        # ResizeToContents would rescan rows on every filter reset.
+        header.setSectionResizeMode(COL_FILE, QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(COL_FIELD, QHeaderView.ResizeMode.Interactive)
         header.setSectionResizeMode(COL_ORIGINAL, QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(COL_TRANSLATION, QHeaderView.ResizeMode.Stretch)
 
@@ -418,8 +650,11 @@ class TranslationTable(QWidget):
         self._selected_row = -1
         self.table.selectionModel().currentRowChanged.connect(self._on_row_selected)
 
-        # Detect edits via model's dataChanged (from in-table editing)
+        # Any repaint of changed entries invalidates filter/stats memos; only
+        # in-table edits need propagation + status_changed (the other edit
+        # paths do their own bookkeeping)
         self._model.dataChanged.connect(self._on_model_data_changed)
+        self._model.translation_edited.connect(self._on_inline_edit)
 
         # ── Stats bar ──────────────────────────────────────────────
         self.stats_label = QLabel("No entries loaded")
@@ -428,16 +663,71 @@ class TranslationTable(QWidget):
     def set_dark_mode(self, dark: bool):
         """Switch row colors between dark and light palettes."""
         self._dark_mode = dark
-        self._model._dark_mode = dark
-        self._model.refresh_all()
+        self._model.set_dark_mode(dark)
+        # Only colors changed, not entry data — repaint the visible cells
+        # rather than a model-wide dataChanged (which would also invalidate
+        # the filter/stats memos)
+        self.table.viewport().update()
 
     def set_entries(self, entries: list):
         """Load full project entries into the table."""
         self._all_entries = entries
         self._entries = entries
+        self._id_to_entry = {e.id: e for e in entries}
+        self._event_index = None
+        self._reset_entry_caches()
+        self._last_filter_sig = None
         self._build_speaker_lookup()
         self._populate_speaker_filter(entries)
         self._apply_filter()
+        if entries:
+            self.table.resizeColumnToContents(COL_FILE)
+            self.table.resizeColumnToContents(COL_FIELD)
+
+    def _reset_entry_caches(self):
+        """Drop the per-entry-ID caches — a new project's IDs may collide."""
+        self._search_cache = {}
+        self._jp_cache = {}
+        self._codes_cache = {}
+        self._swap_done = {}
+        self._match_key = None
+        self._match_src = None
+
+    def append_entries(self, entries: list):
+        """Show *entries* that were just appended to the project list.
+
+        With no filter narrowing the view they are inserted as new rows,
+        keeping selection and scroll position; otherwise the file filter is
+        cleared (as set_entries() did) and the other filters re-apply.
+        """
+        if not entries:
+            return
+        self._id_to_entry.update((e.id, e) for e in entries)
+        self._event_index = None
+        self._build_speaker_lookup()
+        self._populate_speaker_filter(self._all_entries)
+        if (self._entries is self._all_entries and self._id_filter is None
+                and self._filters_inactive()):
+            self._model.append_entries(entries)
+            self._update_stats()
+        else:
+            # Like a project reload, an import clears the file filter
+            self._entries = self._all_entries
+            self.refresh()
+
+    def _filters_inactive(self) -> bool:
+        """True when no search, combo or checkbox filter narrows the view.
+
+        A pending debounced re-filter counts as active: the shown rows may
+        not match the widgets yet.
+        """
+        return (not self._filter_timer.isActive()
+                and not self.search_edit.text()
+                and self.status_filter.currentIndex() == 0
+                and self.field_filter.currentIndex() == 0
+                and self.speaker_filter.currentIndex() <= 0
+                and not self.jp_check.isChecked()
+                and not self.master_check.isChecked())
 
     def update_spell_glossary(self, glossary: dict):
         """Feed glossary terms into spell checker as known words."""
@@ -445,13 +735,13 @@ class TranslationTable(QWidget):
 
     def _populate_speaker_filter(self, entries: list):
         """Extract unique speaker names from entry contexts and populate dropdown."""
-        speakers = set()
-        for e in entries:
-            if not e.context:
-                continue
-            m = re.search(r'\[Speaker:\s*(.+?)\]', e.context)
-            if m:
-                speakers.add(m.group(1).strip())
+        search = _SPEAKER_RE.search
+        speakers = {
+            m.group(1).strip()
+            for m in (search(e.context) for e in entries if e.context)
+            if m
+        }
+        self._context_speakers = speakers
         self.speaker_filter.blockSignals(True)
         current = self.speaker_filter.currentText()
         self.speaker_filter.clear()
@@ -471,32 +761,73 @@ class TranslationTable(QWidget):
         The full project list is kept so text search can span all files.
         """
         self._entries = entries
+        self._last_filter_sig = None
         self._apply_filter()
 
     def clear_file_filter(self):
         """Remove file filter — show all project entries."""
         self._entries = self._all_entries
+        self._last_filter_sig = None
         self._apply_filter()
 
     def refresh(self):
         """Re-apply current filters (after external data changes)."""
+        # Entries were changed behind the table's back — drop every memo
+        # keyed on the data version (filter signature, narrowing, stats)
+        self._data_version += 1
+        self._last_filter_sig = None
         self._apply_filter()
 
     def _schedule_filter(self):
         """Debounce search — wait 250ms after last keystroke before filtering."""
         # Clear pinned ID filter when user starts searching/filtering
         self._id_filter = None
-        self._filter_timer.start()
+        self._filter_timer.start(250)
 
     def _on_filter_changed(self):
-        """Filter dropdown changed — clear pinned ID filter and re-apply."""
+        """Filter dropdown changed — clear pinned ID filter and re-apply shortly."""
         self._id_filter = None
-        self._apply_filter()
+        self._schedule_toggle_filter()
+
+    def _schedule_toggle_filter(self, *_args):
+        """Re-apply after a short 100ms window, so rapid combo/checkbox
+        changes collapse into one scan while still feeling immediate."""
+        self._filter_timer.start(100)
 
     @staticmethod
     def _strip_codes(text: str) -> str:
         """Remove control codes from text for search matching."""
-        return _CODE_RE.sub("", text)
+        return _CODE_SUB("", text)
+
+    def _search_blob(self, e: TranslationEntry) -> str:
+        """Lowercased search text for *e*: code-stripped + raw original/translation.
+
+        Cached per entry ID and revalidated by identity against the entry's
+        current strings, so edits from any path (editor, LLM workers,
+        replace-all) are picked up without explicit invalidation.
+        """
+        cached = self._search_cache.get(e.id)
+        if cached is not None and cached[0] is e.original and cached[1] is e.translation:
+            return cached[2]
+        orig = e.original
+        trans = e.translation or ""
+        # Raw text is included so control codes like \N[1] are findable
+        blob = " ".join((
+            _CODE_SUB("", orig).lower(), _CODE_SUB("", trans).lower(),
+            orig.lower(), trans.lower(),
+        ))
+        self._search_cache[e.id] = (e.original, e.translation, blob)
+        return blob
+
+    def _has_jp_translation(self, e: TranslationEntry) -> bool:
+        """True if *e*'s translation still contains Japanese (cached like _search_blob)."""
+        trans = e.translation
+        cached = self._jp_cache.get(e.id)
+        if cached is not None and cached[0] is trans:
+            return cached[1]
+        has_jp = bool(trans) and _JAPANESE_RE.search(trans) is not None
+        self._jp_cache[e.id] = (trans, has_jp)
+        return has_jp
 
     # Field filter dropdown → set of matching entry.field values
     _FIELD_FILTER_MAP = {
@@ -519,36 +850,82 @@ class TranslationTable(QWidget):
         self._id_filter = entry_ids
         self._apply_filter()
 
+    def _apply_search_filter(self):
+        """Debounce timer slot — lets _apply_filter narrow the previous results."""
+        self._narrow_search = True
+        self._apply_filter()
+
     def _apply_filter(self):
         """Filter visible entries by search text, status, field type, and QA checks.
 
         When a search query or field filter is active, searches ALL project
         entries (ignoring file tree filter) so you can find text across the
         entire game.  Control codes are stripped before matching.
+
+        While typing (debounced search), a query that extends the previous one
+        with all other filters unchanged only rescans the previous matches.
         """
+        narrow = self._narrow_search
+        self._narrow_search = False
+
+        query = self.search_edit.text().lower()
+        status = self.status_filter.currentText().lower()
+        field_label = self.field_filter.currentText()
+        jp_only = self.jp_check.isChecked()
+        speaker = self.speaker_filter.currentText()
+        master = self.master_check.isChecked()
+
+        # Nothing changed since the last run (e.g. combo re-selected, same
+        # paste) — the result would be identical, so skip the rescan.
+        # The ID filter and source list are held and compared by identity:
+        # id() values can be reused once an old list/set is freed.
+        sig = (query, status, field_label, speaker, jp_only, master, self._data_version)
+        last_ids, last_entries = self._last_filter_src
+        if (sig == self._last_filter_sig and last_ids is self._id_filter
+                and last_entries is self._entries):
+            return
+        self._last_filter_sig = sig
+        self._last_filter_src = (self._id_filter, self._entries)
+
         # ID filter takes precedence — show only those entries, ignore others
         if self._id_filter:
+            self._narrow_base = None
             self._visible_entries = [e for e in self._all_entries if e.id in self._id_filter]
             self._dupe_counts = {}
             self._model.set_entries(self._visible_entries, self._dupe_counts)
             self._update_stats()
             return
 
-        query = self.search_edit.text().lower()
-        status = self.status_filter.currentText().lower()
-        field_label = self.field_filter.currentText()
         field_set = self._FIELD_FILTER_MAP.get(field_label)
-        jp_only = self.jp_check.isChecked()
-        speaker = self.speaker_filter.currentText()
         speaker_active = speaker not in ("All Speakers", "")
+        # None = any status.  Entry statuses are interned on load, so
+        # interning the combo text makes the per-entry compare a pointer check
+        status_only = None if status == "all" else sys.intern(status)
+
+        # Support + as AND separator: "\n[1]+she" matches both terms
+        terms = [t.strip() for t in query.split("+") if t.strip()]
+        matches_terms = _all_terms_matcher(terms)
+        # Single-term searches (the common case) skip the matcher call
+        single_term = terms[0] if len(terms) == 1 else None
 
         # Search all entries when query, field filter, speaker, or JP filter is active
         use_all = query or jp_only or field_set is not None or speaker_active
         source = self._all_entries if use_all else self._entries
 
-        self._visible_entries = []
-        for e in source:
-            if status != "all" and e.status != status:
+        state = (status, field_label, speaker, jp_only, self._data_version)
+        base = self._narrow_base
+        scan = source
+        if (narrow and base is not None and base[0] == state and base[3] is source
+                and base[1] and query.startswith(base[1])):
+            # Longer query only adds constraints — previous hits are a superset
+            scan = base[2]
+
+        matched = []
+        append = matched.append
+        search_blob = self._search_blob
+        has_jp = self._has_jp_translation
+        for e in scan:
+            if status_only is not None and e.status != status_only:
                 continue
             if field_set is not None:
                 if field_label == "System / Terms":
@@ -561,32 +938,30 @@ class TranslationTable(QWidget):
             if speaker_active:
                 if speaker == "(No speaker)":
                     # Match entries with no speaker tag in context
-                    if e.context and re.search(r'\[Speaker:', e.context):
+                    if e.context and _SPEAKER_TAG in e.context:
                         continue
                 else:
                     # Match entries with this specific speaker
                     if not e.context or f"[Speaker: {speaker}]" not in e.context:
                         continue
             if query:
-                orig_clean = self._strip_codes(e.original).lower()
-                trans_clean = self._strip_codes(e.translation).lower()
-                # Also search raw text so control codes like \N[1] are findable
-                orig_raw = e.original.lower()
-                trans_raw = (e.translation or "").lower()
-                combined = orig_clean + " " + trans_clean + " " + orig_raw + " " + trans_raw
-                # Support + as AND separator: "\n[1]+she" matches both terms
-                terms = [t.strip() for t in query.split("+") if t.strip()]
-                if not all(t in combined for t in terms):
+                if single_term is not None:
+                    if single_term not in search_blob(e):
+                        continue
+                elif not matches_terms(search_blob(e)):
                     continue
             if jp_only:
                 # Only show entries where the translation contains Japanese
-                if not e.translation or not _JAPANESE_RE.search(e.translation):
+                if not has_jp(e):
                     continue
-            self._visible_entries.append(e)
+            append(e)
+        self._narrow_base = (state, query, matched, source)
+        prev_visible, prev_counts = self._visible_entries, self._dupe_counts
+        self._visible_entries = matched
 
         # Master View: show one entry per unique original text
         self._dupe_counts = {}  # original_text -> count
-        if self.master_check.isChecked():
+        if master:
             seen = {}  # original_text -> first entry
             for e in self._visible_entries:
                 if e.original in seen:
@@ -597,18 +972,32 @@ class TranslationTable(QWidget):
                     self._dupe_counts[e.original] = 1
             self._visible_entries = list(seen.values())
 
+        # Same rows as already shown (e.g. a character typed then deleted) —
+        # keep the model, selection and scroll position; a repaint still picks
+        # up edits (replace all) to the shown entries.  Compared by identity:
+        # a reloaded project has equal but distinct entries.
+        visible = self._visible_entries
+        if (len(visible) == len(prev_visible) and self._dupe_counts == prev_counts
+                and all(map(is_, visible, prev_visible))):
+            self._visible_entries = prev_visible
+            self.table.viewport().update()
+            self._update_stats()
+            return
+
         self._model.set_entries(self._visible_entries, self._dupe_counts)
         self._update_stats()
 
-    def _on_model_data_changed(self, top_left, bottom_right, roles=None):
-        """Handle edits made via the table's inline editor or refresh."""
+    def _on_model_data_changed(self, *args):
+        """Model rows repainted via dataChanged — stale filter/narrow state."""
+        self._data_version += 1
+
+    def _on_inline_edit(self, row: int, status_changed: bool):
+        """Handle edits made via the table's inline editor."""
         # Propagate inline edits to duplicates in master view
-        row = getattr(self._model, '_last_inline_edit_row', -1)
-        self._model._last_inline_edit_row = -1  # Always reset flag
-        if row >= 0 and self.master_check.isChecked():
-            if 0 <= row < len(self._visible_entries):
-                self._propagate_to_duplicates(self._visible_entries[row])
-        self._update_stats()
+        if self.master_check.isChecked() and 0 <= row < len(self._visible_entries):
+            self._propagate_to_duplicates(self._visible_entries[row])
+        if status_changed:
+            self._update_stats()
         self.status_changed.emit()
 
     def _propagate_to_duplicates(self, source: TranslationEntry):
@@ -622,27 +1011,79 @@ class TranslationTable(QWidget):
 
     def update_entry(self, entry_id: str, translation: str):
         """Update a specific entry's translation (called after LLM translates)."""
-        for row, entry in enumerate(self._visible_entries):
-            if entry.id == entry_id:
-                entry.translation = translation
-                entry.status = "translated"
-                self._model.refresh_row(row)
-                # Also update editor panel if this row is selected
-                if row == self._selected_row:
-                    self.trans_editor.blockSignals(True)
-                    self.trans_editor.setPlainText(translation)
-                    self.trans_editor.blockSignals(False)
-                break
+        self._data_version += 1
+        row = self._model.row_for_id(entry_id)
+        if row is not None:
+            entry = self._visible_entries[row]
+            entry.translation = translation
+            entry.status = "translated"
+            # Also update editor panel if this row is selected
+            if row == self._selected_row:
+                self.trans_editor.blockSignals(True)
+                self._set_editor_text(self.trans_editor, translation)
+                self.trans_editor.blockSignals(False)
+        # Repaint, stats and status_changed are deferred to the next tick so
+        # a burst of results costs one refresh
+        self._pending_update_ids.add(entry_id)
+        if not self._update_flush_timer.isActive():
+            self._update_flush_timer.start()
+
+    def _flush_entry_updates(self):
+        """Refresh rows touched by update_entry() since the last tick."""
+        ids, self._pending_update_ids = self._pending_update_ids, set()
+        row_for_id = self._model.row_for_id
+        rows = [r for r in map(row_for_id, ids) if r is not None]
+        if rows:
+            self._model.refresh_span(rows)
         self._update_stats()
         self.status_changed.emit()
 
+    def update_entries(self, updates: list[tuple[str, str]]):
+        """Bulk update_entry: apply (entry_id, translation) pairs with one refresh.
+
+        Rows are repainted in contiguous runs and stats/status_changed fire
+        once, instead of once per entry.
+        """
+        if not updates:
+            return
+        self._data_version += 1
+        rows = []
+        for entry_id, translation in updates:
+            row = self._model.row_for_id(entry_id)
+            if row is None:
+                continue
+            entry = self._visible_entries[row]
+            entry.translation = translation
+            entry.status = "translated"
+            rows.append(row)
+            # Also update editor panel if this row is selected
+            if row == self._selected_row:
+                self.trans_editor.blockSignals(True)
+                self._set_editor_text(self.trans_editor, translation)
+                self.trans_editor.blockSignals(False)
+        self._model.refresh_span(rows)
+        self._update_stats()
+        self.status_changed.emit()
+
+    def _selected_rows(self) -> list[int]:
+        """Sorted, de-duplicated selected row numbers.
+
+        Read from the selection's row ranges rather than selectedRows(),
+        which builds a QModelIndex per selected row.
+        """
+        rows = set()
+        for rng in self.table.selectionModel().selection():
+            rows.update(range(rng.top(), rng.bottom() + 1))
+        return sorted(rows)
+
     def get_selected_entry_ids(self) -> list:
         """Return IDs of currently selected entries."""
-        rows = set(idx.row() for idx in self.table.selectionModel().selectedRows())
-        return [self._visible_entries[r].id for r in sorted(rows) if r < len(self._visible_entries)]
+        visible = self._visible_entries
+        n = len(visible)
+        return [visible[r].id for r in self._selected_rows() if r < n]
 
-    def _show_context_menu(self, pos):
-        """Right-click context menu."""
+    def _build_context_menu(self) -> QMenu:
+        """Build the table's right-click menu once; actions act on the selection."""
         menu = QMenu(self)
 
         translate_action = QAction("Translate Selected", self)
@@ -664,15 +1105,15 @@ class TranslationTable(QWidget):
         menu.addSeparator()
 
         review_action = QAction("Mark as Reviewed", self)
-        review_action.triggered.connect(lambda: self._set_status("reviewed"))
+        review_action.triggered.connect(partial(self._set_status, "reviewed"))
         menu.addAction(review_action)
 
         skip_action = QAction("Mark as Skipped", self)
-        skip_action.triggered.connect(lambda: self._set_status("skipped"))
+        skip_action.triggered.connect(partial(self._set_status, "skipped"))
         menu.addAction(skip_action)
 
         unmark_action = QAction("Mark as Untranslated", self)
-        unmark_action.triggered.connect(lambda: self._set_status("untranslated"))
+        unmark_action.triggered.connect(partial(self._set_status, "untranslated"))
         menu.addAction(unmark_action)
 
         menu.addSeparator()
@@ -684,11 +1125,11 @@ class TranslationTable(QWidget):
         menu.addSeparator()
 
         swap_f2m = QAction("Swap Pronouns (she/her \u2192 he/him)", self)
-        swap_f2m.triggered.connect(lambda: self._swap_pronouns("f2m"))
+        swap_f2m.triggered.connect(partial(self._swap_pronouns, "f2m"))
         menu.addAction(swap_f2m)
 
         swap_m2f = QAction("Swap Pronouns (he/him \u2192 she/her)", self)
-        swap_m2f.triggered.connect(lambda: self._swap_pronouns("m2f"))
+        swap_m2f.triggered.connect(partial(self._swap_pronouns, "m2f"))
         menu.addAction(swap_m2f)
 
         menu.addSeparator()
@@ -704,11 +1145,11 @@ class TranslationTable(QWidget):
         menu.addSeparator()
 
         add_proj_glossary = QAction("Add to Project Glossary...", self)
-        add_proj_glossary.triggered.connect(lambda: self._add_row_to_glossary("project"))
+        add_proj_glossary.triggered.connect(partial(self._add_row_to_glossary, "project"))
         menu.addAction(add_proj_glossary)
 
         add_gen_glossary = QAction("Add to General Glossary...", self)
-        add_gen_glossary.triggered.connect(lambda: self._add_row_to_glossary("general"))
+        add_gen_glossary.triggered.connect(partial(self._add_row_to_glossary, "general"))
         menu.addAction(add_gen_glossary)
 
         menu.addSeparator()
@@ -717,7 +1158,11 @@ class TranslationTable(QWidget):
         ctx_action.triggered.connect(self._show_context_pane)
         menu.addAction(ctx_action)
 
-        menu.exec(self.table.viewport().mapToGlobal(pos))
+        return menu
+
+    def _show_context_menu(self, pos):
+        """Right-click context menu."""
+        self._ctx_menu.exec(self.table.viewport().mapToGlobal(pos))
 
     def _translate_selected(self):
         """Emit signal to translate selected entries."""
@@ -754,26 +1199,28 @@ class TranslationTable(QWidget):
 
     def _set_status(self, status: str):
         """Set status for all selected rows."""
-        rows = sorted(set(idx.row() for idx in self.table.selectionModel().selectedRows()))
+        rows = self._selected_rows()
         for row in rows:
             if row < len(self._visible_entries):
                 entry = self._visible_entries[row]
                 entry.status = status
                 if self.master_check.isChecked():
                     self._propagate_to_duplicates(entry)
-                self._model.refresh_row(row)
+        # Entries are all mutated first, then one dataChanged covers the
+        # selection's span — the view repaints only what's on screen
+        self._model.refresh_span(rows)
         self._update_stats()
         self.status_changed.emit()
 
     def _copy_original(self):
         """Copy original text to translation column for selected rows."""
-        rows = sorted(set(idx.row() for idx in self.table.selectionModel().selectedRows()))
+        rows = self._selected_rows()
         for row in rows:
             if row < len(self._visible_entries):
                 entry = self._visible_entries[row]
                 entry.translation = entry.original
                 entry.status = "translated"
-                self._model.refresh_row(row)
+        self._model.refresh_span(rows)
         self._update_stats()
         self.status_changed.emit()
 
@@ -784,104 +1231,39 @@ class TranslationTable(QWidget):
         """Swap gendered pronouns and gendered nouns in *text*.
 
         *direction* is ``"f2m"`` (she→he) or ``"m2f"`` (he→she).
-        Order matters: longer / compound forms are replaced first so that
-        e.g. ``herself`` isn't partially matched by the ``her`` rule.
+        All words are swapped in a single regex pass (see ``_PRONOUN_SWAPS``).
         """
-        if direction == "f2m":
-            # she/her → he/him  (order: compounds first)
-            text = re.sub(r'\bherself\b', 'himself', text)
-            text = re.sub(r'\bHerself\b', 'Himself', text)
-            text = re.sub(r'\bhers\b', 'his', text)
-            text = re.sub(r'\bHers\b', 'His', text)
-            text = re.sub(r"\bshe's\b", "he's", text)
-            text = re.sub(r"\bShe's\b", "He's", text)
-            # "her" before a lowercase word → possessive "his"
-            text = re.sub(r'\bher(\s+[a-z])', r'his\1', text)
-            text = re.sub(r'\bHer(\s+[a-z])', r'His\1', text)
-            # "her" in all other positions → object "him"
-            text = re.sub(r'\bher\b', 'him', text)
-            text = re.sub(r'\bHer\b', 'Him', text)
-            # Simple subject
-            text = re.sub(r'\bshe\b', 'he', text)
-            text = re.sub(r'\bShe\b', 'He', text)
-            # Gendered nouns
-            text = re.sub(r'\bgirls\b', 'guys', text)
-            text = re.sub(r'\bGirls\b', 'Guys', text)
-            text = re.sub(r'\bgirl\b', 'guy', text)
-            text = re.sub(r'\bGirl\b', 'Guy', text)
-            text = re.sub(r'\bwoman\b', 'man', text)
-            text = re.sub(r'\bWoman\b', 'Man', text)
-            text = re.sub(r'\bwomen\b', 'men', text)
-            text = re.sub(r'\bWomen\b', 'Men', text)
-            text = re.sub(r'\blady\b', 'gentleman', text)
-            text = re.sub(r'\bLady\b', 'Gentleman', text)
-            text = re.sub(r'\bmother\b', 'father', text)
-            text = re.sub(r'\bMother\b', 'Father', text)
-            text = re.sub(r'\bsister\b', 'brother', text)
-            text = re.sub(r'\bSister\b', 'Brother', text)
-            text = re.sub(r'\bdaughter\b', 'son', text)
-            text = re.sub(r'\bDaughter\b', 'Son', text)
-            text = re.sub(r'\bwife\b', 'husband', text)
-            text = re.sub(r'\bWife\b', 'Husband', text)
-            text = re.sub(r'\bheroine\b', 'hero', text)
-            text = re.sub(r'\bHeroine\b', 'Hero', text)
-        else:
-            # he/him → she/her  (order: compounds first)
-            text = re.sub(r'\bhimself\b', 'herself', text)
-            text = re.sub(r'\bHimself\b', 'Herself', text)
-            text = re.sub(r"\bhe's\b", "she's", text)
-            text = re.sub(r"\bHe's\b", "She's", text)
-            # "his" before a lowercase word → possessive "her"
-            text = re.sub(r'\bhis(\s+[a-z])', r'her\1', text)
-            text = re.sub(r'\bHis(\s+[a-z])', r'Her\1', text)
-            # "his" standalone → "hers"
-            text = re.sub(r'\bhis\b', 'hers', text)
-            text = re.sub(r'\bHis\b', 'Hers', text)
-            # "him" → "her"
-            text = re.sub(r'\bhim\b', 'her', text)
-            text = re.sub(r'\bHim\b', 'Her', text)
-            # Simple subject
-            text = re.sub(r'\bhe\b', 'she', text)
-            text = re.sub(r'\bHe\b', 'She', text)
-            # Gendered nouns
-            text = re.sub(r'\bguys\b', 'girls', text)
-            text = re.sub(r'\bGuys\b', 'Girls', text)
-            text = re.sub(r'\bguy\b', 'girl', text)
-            text = re.sub(r'\bGuy\b', 'Girl', text)
-            text = re.sub(r'\bmen\b', 'women', text)
-            text = re.sub(r'\bMen\b', 'Women', text)
-            text = re.sub(r'\bman\b', 'woman', text)
-            text = re.sub(r'\bMan\b', 'Woman', text)
-            text = re.sub(r'\bgentleman\b', 'lady', text)
-            text = re.sub(r'\bGentleman\b', 'Lady', text)
-            text = re.sub(r'\bfather\b', 'mother', text)
-            text = re.sub(r'\bFather\b', 'Mother', text)
-            text = re.sub(r'\bbrother\b', 'sister', text)
-            text = re.sub(r'\bBrother\b', 'Sister', text)
-            text = re.sub(r'\bson\b', 'daughter', text)
-            text = re.sub(r'\bSon\b', 'Daughter', text)
-            text = re.sub(r'\bhusband\b', 'wife', text)
-            text = re.sub(r'\bHusband\b', 'Wife', text)
-            text = re.sub(r'\bhero\b', 'heroine', text)
-            text = re.sub(r'\bHero\b', 'Heroine', text)
-        return text
+        return _PRONOUN_SWAPS[direction](text)
 
     def _swap_pronouns(self, direction: str):
         """Swap gendered pronouns in selected rows' translations."""
-        rows = sorted(set(idx.row() for idx in self.table.selectionModel().selectedRows()))
-        changed = 0
+        rows = self._selected_rows()
+        # Forget records whose entry has been edited since — they can never
+        # match again, and would otherwise pin old translations forever
+        id_to_entry = self._id_to_entry
+        self._swap_done = {
+            k: v for k, v in self._swap_done.items()
+            if k in id_to_entry and id_to_entry[k].translation is v[1]
+        }
+        swapped = []
         for row in rows:
             if row >= len(self._visible_entries):
                 continue
             entry = self._visible_entries[row]
             if not entry.translation:
                 continue
+            # A swap is idempotent — skip text this direction already produced
+            done = self._swap_done.get(entry.id)
+            if done is not None and done[0] == direction and done[1] is entry.translation:
+                continue
             new_text = self._apply_pronoun_swap(entry.translation, direction)
             if new_text != entry.translation:
                 entry.translation = new_text
-                self._model.refresh_row(row)
-                changed += 1
+                swapped.append(row)
+            self._swap_done[entry.id] = (direction, entry.translation)
+        changed = len(swapped)
         if changed:
+            self._model.refresh_span(swapped)
             self._update_stats()
             self.status_changed.emit()
         label = "she/her \u2192 he/him" if direction == "f2m" else "he/him \u2192 she/her"
@@ -894,23 +1276,17 @@ class TranslationTable(QWidget):
 
     def _set_speaker(self):
         """Assign a speaker name to selected entries' context."""
-        rows = sorted(set(idx.row() for idx in self.table.selectionModel().selectedRows()))
+        rows = self._selected_rows()
         if not rows:
             return
 
-        # Collect known speakers from existing contexts
-        speakers = set()
-        for e in self._all_entries:
-            if e.context:
-                m = re.search(r'\[Speaker:\s*(.+?)\]', e.context)
-                if m:
-                    speakers.add(m.group(1).strip())
+        # Known speakers from existing contexts (kept by the speaker filter)
+        speakers = set(self._context_speakers)
         # Also collect actor names from DB entries (translated or original)
-        for e in self._all_entries:
-            if e.field == "name" and e.file == "Actors.json":
-                name = (e.translation or e.original).strip()
-                if name:
-                    speakers.add(name)
+        for e in self._actor_name_entries:
+            name = (e.translation or e.original).strip()
+            if name:
+                speakers.add(name)
 
         items = sorted(speakers)
         name, ok = QInputDialog.getItem(
@@ -922,18 +1298,17 @@ class TranslationTable(QWidget):
             return
 
         name = name.strip()
+        tag = f"[Speaker: {name}]"
         changed = 0
         for row in rows:
             if row >= len(self._visible_entries):
                 continue
             entry = self._visible_entries[row]
-            if entry.context and re.search(r'\[Speaker:', entry.context):
-                entry.context = re.sub(
-                    r'\[Speaker:\s*.+?\]', f'[Speaker: {name}]', entry.context
-                )
+            if entry.context and _SPEAKER_TAG in entry.context:
+                # Callable replacement: names are literal, not escape templates
+                entry.context = _SPEAKER_RE.sub(lambda _m: tag, entry.context)
             else:
-                prefix = f"[Speaker: {name}]"
-                entry.context = f"{prefix}\n{entry.context}" if entry.context else prefix
+                entry.context = f"{tag}\n{entry.context}" if entry.context else tag
             changed += 1
 
         if changed:
@@ -946,7 +1321,7 @@ class TranslationTable(QWidget):
 
     def _clear_speaker(self):
         """Remove speaker tag from selected entries' context."""
-        rows = sorted(set(idx.row() for idx in self.table.selectionModel().selectedRows()))
+        rows = self._selected_rows()
         if not rows:
             return
 
@@ -956,7 +1331,7 @@ class TranslationTable(QWidget):
                 continue
             entry = self._visible_entries[row]
             if entry.context and '[Speaker:' in entry.context:
-                entry.context = re.sub(r'\[Speaker:\s*.+?\]\n?', '', entry.context)
+                entry.context = _SPEAKER_STRIP_RE.sub('', entry.context)
                 changed += 1
 
         if changed:
@@ -973,11 +1348,7 @@ class TranslationTable(QWidget):
         if not ids:
             return
         # Use the first selected entry
-        entry = None
-        for e in self._visible_entries:
-            if e.id == ids[0]:
-                entry = e
-                break
+        entry = self._id_to_entry.get(ids[0])
         if not entry:
             return
         jp_term = entry.original.strip()
@@ -1011,13 +1382,28 @@ class TranslationTable(QWidget):
 
         # Block signals while loading to avoid feedback loop
         self.trans_editor.blockSignals(True)
-        self.orig_editor.setPlainText(entry.original)
-        self.trans_editor.setPlainText(entry.translation)
+        self._set_editor_text(self.orig_editor, entry.original)
+        if not self._set_editor_text(self.trans_editor, entry.translation):
+            # Same text as the previous row — its undo history doesn't apply here
+            self.trans_editor.document().clearUndoRedoStacks()
         self.trans_editor.blockSignals(False)
 
         if self.bottom_tabs.currentIndex() == 1:
             self._update_context_pane(entry)
 
+    @staticmethod
+    def _set_editor_text(editor: QTextEdit, text: str) -> bool:
+        """setPlainText() unless *editor* already shows *text*.
+
+        Setting rebuilds and re-lays-out the whole document, so skipping the
+        no-op case keeps rapid row changes and repeated updates cheap.
+        Returns whether the text was replaced.
+        """
+        if editor.toPlainText() == text:
+            return False
+        editor.setPlainText(text)
+        return True
+
     @staticmethod
     def _event_prefix(entry_id: str) -> str:
         """Extract event prefix — delegates to shared translator.utils."""
@@ -1026,11 +1412,14 @@ class TranslationTable(QWidget):
     def _build_speaker_lookup(self):
         """Build JP->EN speaker name lookup from speaker_name and actor entries."""
         self._speaker_lookup = {}
+        self._actor_name_entries = []
         for e in self._all_entries:
             if e.field == "speaker_name" and e.translation:
                 self._speaker_lookup[e.original.strip()] = e.translation.strip()
-            elif e.field == "name" and e.file == "Actors.json" and e.translation:
-                self._speaker_lookup[e.original.strip()] = e.translation.strip()
+            elif e.field == "name" and e.file == "Actors.json":
+                self._actor_name_entries.append(e)
+                if e.translation:
+                    self._speaker_lookup[e.original.strip()] = e.translation.strip()
 
     def _show_context_pane(self):
         """Switch to the Event Context tab and populate it."""
@@ -1045,20 +1434,38 @@ class TranslationTable(QWidget):
         if index == 1 and 0 <= self._selected_row < len(self._visible_entries):
             self._update_context_pane(self._visible_entries[self._selected_row])
 
+    def _event_entries(self, prefix: str) -> list:
+        """All project entries whose ID starts with ``prefix + "/"``, in order.
+
+        Served from an index keyed by every "/"-prefix of every entry ID,
+        built on first use after the entry list changes.
+        """
+        if self._event_index is None:
+            index = {}
+            for e in self._all_entries:
+                eid = e.id
+                i = eid.find("/")
+                while i != -1:
+                    if i > 0:
+                        index.setdefault(eid[:i], []).append(e)
+                    i = eid.find("/", i + 1)
+            self._event_index = index
+        return self._event_index.get(prefix, [])
+
     def _update_context_pane(self, selected_entry):
         """Show surrounding entries from the same event in the context table."""
         self.context_table.blockSignals(True)
-        self.context_table.setRowCount(0)
 
         prefix = self._event_prefix(selected_entry.id)
         if not prefix:
+            self.context_table.setRowCount(0)
             self.context_table.blockSignals(False)
             return
 
         # Find all entries from the same event (search ALL entries, not just visible)
-        event_entries = [e for e in self._all_entries
-                         if e.id.startswith(prefix + "/")]
+        event_entries = self._event_entries(prefix)
         if not event_entries:
+            self.context_table.setRowCount(0)
             self.context_table.blockSignals(False)
             return
 
@@ -1099,18 +1506,20 @@ class TranslationTable(QWidget):
             speaker_fg = QColor("#0066cc")
             speaker_sel_fg = QColor("#004499")
 
+        # Rows (and their items) are reused across selections — only the
+        # count changes, and every cell's text/colors/font are rewritten below
         self.context_table.setRowCount(end - start)
         highlight_row = -1
+        cell = self._context_cell
 
         for row_idx, i in enumerate(range(start, end)):
             e = event_entries[i]
             # Extract speaker from context
             speaker_jp = ""
             if e.context:
-                for line in e.context.split("\n"):
-                    if line.startswith("[Speaker:"):
-                        speaker_jp = line.strip("[]").replace("Speaker: ", "")
-                        break
+                m = _SPEAKER_LINE_RE.search(e.context)
+                if m:
+                    speaker_jp = m.group(1)
 
             # Translate speaker name
             speaker_en = self._speaker_lookup.get(speaker_jp, "") if speaker_jp else ""
@@ -1120,23 +1529,18 @@ class TranslationTable(QWidget):
             trans = e.translation or ""
 
             # Speaker column (read-only)
-            spk_item = QTableWidgetItem(speaker_display)
-            spk_item.setFlags(
-                Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
+            spk_item = cell(row_idx, 0, speaker_display, editable=False)
             spk_item.setData(Qt.ItemDataRole.UserRole, e.id)
-            if speaker_jp and speaker_en and speaker_en != speaker_jp:
-                spk_item.setToolTip(f"JP: {speaker_jp}")
-            self.context_table.setItem(row_idx, 0, spk_item)
+            spk_item.setData(
+                Qt.ItemDataRole.ToolTipRole,
+                f"JP: {speaker_jp}"
+                if speaker_jp and speaker_en and speaker_en != speaker_jp else None)
 
             # Original column (read-only)
-            orig_item = QTableWidgetItem(orig)
-            orig_item.setFlags(
-                Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
-            self.context_table.setItem(row_idx, 1, orig_item)
+            cell(row_idx, 1, orig, editable=False)
 
             # Translation column (editable via double-click)
-            trans_item = QTableWidgetItem(trans)
-            self.context_table.setItem(row_idx, 2, trans_item)
+            cell(row_idx, 2, trans, editable=True)
 
             # Apply colors
             is_selected = (i == sel_idx)
@@ -1158,6 +1562,7 @@ class TranslationTable(QWidget):
                     item = self.context_table.item(row_idx, col)
                     item.setBackground(bg)
                     item.setForeground(fg)
+                    item.setData(Qt.ItemDataRole.FontRole, None)  # drop reused bold
 
             # Speaker name in accent color for readability
             if speaker_display:
@@ -1171,6 +1576,19 @@ class TranslationTable(QWidget):
             self.context_table.scrollToItem(
                 self.context_table.item(highlight_row, 0))
 
+    def _context_cell(self, row: int, col: int, text: str, editable: bool):
+        """Context-table item at (row, col) set to *text*, created on first use."""
+        item = self.context_table.item(row, col)
+        if item is None:
+            item = QTableWidgetItem(text)
+            if not editable:
+                item.setFlags(
+                    Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
+            self.context_table.setItem(row, col, item)
+        else:
+            item.setText(text)
+        return item
+
     def eventFilter(self, obj, event):
         """Ctrl+C on context table → copy selected cell text to clipboard."""
         if obj is self.context_table and isinstance(event, QKeyEvent):
@@ -1201,21 +1619,21 @@ class TranslationTable(QWidget):
         if not entry_id:
             return
         new_text = self.context_table.item(row, 2).text()
-        for entry in self._all_entries:
-            if entry.id == entry_id:
-                entry.translation = new_text
-                entry.status = "translated" if new_text.strip() else "untranslated"
-                if (self._selected_row >= 0
-                        and self._selected_row < len(self._visible_entries)
-                        and self._visible_entries[self._selected_row].id == entry_id):
-                    self.trans_editor.blockSignals(True)
-                    self.trans_editor.setPlainText(new_text)
-                    self.trans_editor.blockSignals(False)
-                for vrow, ve in enumerate(self._visible_entries):
-                    if ve.id == entry_id:
-                        self._model.refresh_row(vrow)
-                        break
-                break
+        entry = self._id_to_entry.get(entry_id)
+        if entry is None:
+            return
+        entry.translation = new_text
+        entry.status = "translated" if new_text.strip() else "untranslated"
+        vrow = self._model.row_for_id(entry_id)
+        if vrow is not None:
+            if vrow == self._selected_row:
+                self.trans_editor.blockSignals(True)
+                self._set_editor_text(self.trans_editor, new_text)
+                self.trans_editor.blockSignals(False)
+            self._model.refresh_row(vrow)
+        self._data_version += 1
+        self._update_stats()
+        self.status_changed.emit()
 
     def _on_editor_changed(self):
         """Save edits from the translation editor back to the entry and table."""
@@ -1225,21 +1643,50 @@ class TranslationTable(QWidget):
 
         entry = self._visible_entries[row]
         new_text = self.trans_editor.toPlainText()
-        entry.translation = new_text
-
         if not new_text.strip():
-            entry.status = "untranslated"
+            new_status = "untranslated"
         elif entry.status not in ("translated", "reviewed"):
-            entry.status = "translated"
+            new_status = "translated"
+        else:
+            new_status = entry.status
+
+        # Nothing to store (e.g. an undo back to the saved text) — skip the
+        # dataChanged round trip and duplicate propagation
+        if new_text == entry.translation and new_status == entry.status:
+            return
+        status_changed = new_status != entry.status
+        entry.translation = new_text
+        entry.status = new_status
 
         # Propagate to duplicates if master view is on
         if self.master_check.isChecked():
             self._propagate_to_duplicates(entry)
 
-        # Sync back to the model (refreshes colors + status icon)
-        # Note: refresh_row triggers dataChanged → _on_model_data_changed → status_changed
-        # so we don't need a separate emit here
-        self._model.refresh_row(row)
+        # Sync back to the model (refreshes colors + status icon), debounced;
+        # the flush also updates stats and emits status_changed
+        self._data_version += 1
+        if self._editor_refresh_id not in (None, entry.id):
+            self._flush_editor_refresh()  # different row still pending
+        self._editor_refresh_id = entry.id
+        self._editor_refresh_full = self._editor_refresh_full or status_changed
+        self._editor_refresh_timer.start()
+
+    def _flush_editor_refresh(self):
+        """Repaint the row last edited in the translation editor."""
+        self._editor_refresh_timer.stop()
+        entry_id, self._editor_refresh_id = self._editor_refresh_id, None
+        full, self._editor_refresh_full = self._editor_refresh_full, False
+        if entry_id is None:
+            return
+        row = self._model.row_for_id(entry_id)
+        if row is not None:
+            if full:
+                self._model.refresh_row(row)  # status icon + row color too
+            else:
+                self._model.refresh_row(row, COL_TRANSLATION, COL_TRANSLATION)
+        if full:
+            self._update_stats()  # counts only move when a status did
+        self.status_changed.emit()
 
     def _show_editor_context_menu(self, pos):
         """Right-click menu on translation editor — spell check + glossary + insert codes."""
@@ -1265,16 +1712,19 @@ class TranslationTable(QWidget):
             return
 
         entry = self._visible_entries[row]
-        orig_codes = _CODE_RE.findall(entry.original)
+        orig_codes = self._original_codes(entry)
         if not orig_codes:
             menu.exec(self.trans_editor.mapToGlobal(pos))
             return
 
         menu.addSeparator()
 
-        # Find which codes are missing from the translation
-        trans_text = self.trans_editor.toPlainText()
-        missing = [c for c in orig_codes if c not in trans_text]
+        # Find which codes are missing from the translation — one regex pass
+        # over the text instead of a substring scan per code (this also stops
+        # \V[1] from counting as present just because \V[10] is).
+        present = set(_CODE_FINDALL(self.trans_editor.toPlainText()))
+        missing = [c for c in orig_codes if c not in present]
+        missing_set = set(missing)
 
         if missing:
             restore_action = QAction(f"Restore {len(missing)} Missing Code(s)", self)
@@ -1282,10 +1732,10 @@ class TranslationTable(QWidget):
             menu.addAction(restore_action)
             menu.addSeparator()
 
-        # List each code from the original for individual insertion
-        for code in orig_codes:
+        # List each distinct code from the original (in order) for insertion
+        for code in dict.fromkeys(orig_codes):
             label = f"Insert {code}"
-            if code in missing:
+            if code in missing_set:
                 label += "  (missing)"
             action = QAction(label, self)
             action.triggered.connect(lambda checked, c=code: self._insert_code_at_cursor(c))
@@ -1293,6 +1743,15 @@ class TranslationTable(QWidget):
 
         menu.exec(self.trans_editor.mapToGlobal(pos))
 
+    def _original_codes(self, entry: TranslationEntry) -> tuple:
+        """Control codes in *entry*'s original text, cached like _search_blob."""
+        cached = self._codes_cache.get(entry.id)
+        if cached is not None and cached[0] is entry.original:
+            return cached[1]
+        codes = tuple(_CODE_FINDALL(entry.original))
+        self._codes_cache[entry.id] = (entry.original, codes)
+        return codes
+
     def _show_orig_context_menu(self, pos):
         """Right-click menu on original editor — glossary add from JP selection."""
         menu = self.orig_editor.createStandardContextMenu()
@@ -1367,22 +1826,34 @@ class TranslationTable(QWidget):
 
         entries_changed = 0
         total_occurrences = 0
+        # Occurrences follow from the length change, so a single replace()
+        # both tests and rewrites each entry (count() only if lengths match)
+        delta = len(replace) - len(find)
         for entry in self._all_entries:
-            if not entry.translation or find not in entry.translation:
+            trans = entry.translation
+            if not trans:
+                continue
+            if delta:
+                new = trans.replace(find, replace)
+                count = (len(new) - len(trans)) // delta
+            else:
+                count = trans.count(find)
+                new = trans.replace(find, replace) if count else trans
+            if not count:
                 continue
-            count = entry.translation.count(find)
-            entry.translation = entry.translation.replace(find, replace)
+            entry.translation = new
             total_occurrences += count
             entries_changed += 1
 
         if entries_changed:
+            self._data_version += 1
             self._apply_filter()
             self.status_changed.emit()
             # Update editor panel if currently selected row was affected
             if 0 <= self._selected_row < len(self._visible_entries):
                 entry = self._visible_entries[self._selected_row]
                 self.trans_editor.blockSignals(True)
-                self.trans_editor.setPlainText(entry.translation)
+                self._set_editor_text(self.trans_editor, entry.translation)
                 self.trans_editor.blockSignals(False)
 
         self._replace_status.setText(
@@ -1396,11 +1867,14 @@ class TranslationTable(QWidget):
         if not find:
             return
 
-        # Search from next position forward through all entries
+        # Search from next position forward through the matching entries,
+        # wrapping around (current position last)
         n = len(self._all_entries)
-        for offset in range(1, n + 1):
-            idx = (self._replace_index + offset) % n
+        matches = self._find_matches(find)
+        pos = bisect_right(matches, self._replace_index)
+        for idx in matches[pos:] + matches[:pos]:
             entry = self._all_entries[idx]
+            # Re-check: a replace since the index was built may have used it up
             if entry.translation and find in entry.translation:
                 self._replace_index = idx
                 self._select_entry_by_id(entry.id)
@@ -1411,6 +1885,32 @@ class TranslationTable(QWidget):
 
         self._replace_status.setText("No matches found")
 
+    def _match_cache_key(self, find: str) -> tuple:
+        return (find, len(self._all_entries), self._data_version)
+
+    def _match_cache_fresh(self, find: str) -> bool:
+        """True if _match_indices was built for *find* over the current entries.
+
+        The entry list is held and compared by identity — id() values can
+        be reused once a previous project's list is freed.
+        """
+        return (self._match_src is self._all_entries
+                and self._match_key == self._match_cache_key(find))
+
+    def _find_matches(self, find: str) -> list[int]:
+        """Sorted _all_entries indices whose translation contains *find*.
+
+        Built once per Find text / entry edit and reused across Next presses.
+        """
+        if not self._match_cache_fresh(find):
+            self._match_indices = [
+                i for i, e in enumerate(self._all_entries)
+                if e.translation and find in e.translation
+            ]
+            self._match_key = self._match_cache_key(find)
+            self._match_src = self._all_entries
+        return self._match_indices
+
     def _replace_current_and_next(self):
         """Replace in the current match and advance to next."""
         find = self._find_edit.text()
@@ -1422,16 +1922,21 @@ class TranslationTable(QWidget):
         if self._replace_index < len(self._all_entries):
             entry = self._all_entries[self._replace_index]
             if entry.translation and find in entry.translation:
+                in_sync = self._match_cache_fresh(find)
                 entry.translation = entry.translation.replace(find, replace, 1)
+                self._data_version += 1
                 # Update table display
-                for row, ve in enumerate(self._visible_entries):
-                    if ve.id == entry.id:
-                        self._model.refresh_row(row)
-                        if row == self._selected_row:
-                            self.trans_editor.blockSignals(True)
-                            self.trans_editor.setPlainText(entry.translation)
-                            self.trans_editor.blockSignals(False)
-                        break
+                row = self._model.row_for_id(entry.id)
+                if row is not None:
+                    self._model.refresh_row(row)
+                    if row == self._selected_row:
+                        self.trans_editor.blockSignals(True)
+                        self._set_editor_text(self.trans_editor, entry.translation)
+                        self.trans_editor.blockSignals(False)
+                if in_sync:
+                    # Only this entry changed and matches are re-checked on
+                    # use, so the index stays valid — skip the O(N) rebuild
+                    self._match_key = self._match_cache_key(find)
                 self.status_changed.emit()
 
         # Advance to next match (_replace_next starts at offset=1 from current)
@@ -1440,24 +1945,28 @@ class TranslationTable(QWidget):
     def _select_entry_by_id(self, entry_id: str):
         """Select and scroll to an entry by ID in the visible table."""
         # First try to find in current visible entries
-        for row, entry in enumerate(self._visible_entries):
-            if entry.id == entry_id:
-                index = self._model.index(row, 0)
-                self.table.setCurrentIndex(index)
-                self.table.scrollTo(index)
-                return
+        row = self._model.row_for_id(entry_id)
+        if row is not None:
+            index = self._model.index(row, 0)
+            self.table.setCurrentIndex(index)
+            self.table.scrollTo(index)
+            return
+
+        # Unknown ID, or no file filter to lift — re-filtering can't reveal it
+        if entry_id not in self._id_to_entry or self._entries is self._all_entries:
+            return
 
         # Not visible — temporarily clear file filter, find, then restore
         prev_entries = self._entries
         self._entries = self._all_entries
         self._apply_filter()
 
-        for row, entry in enumerate(self._visible_entries):
-            if entry.id == entry_id:
-                index = self._model.index(row, 0)
-                self.table.setCurrentIndex(index)
-                self.table.scrollTo(index)
-                return
+        row = self._model.row_for_id(entry_id)
+        if row is not None:
+            index = self._model.index(row, 0)
+            self.table.setCurrentIndex(index)
+            self.table.scrollTo(index)
+            return
 
         # Entry not found — restore previous filter
         self._entries = prev_entries
@@ -1465,9 +1974,21 @@ class TranslationTable(QWidget):
 
     def _update_stats(self):
         """Update the stats label."""
-        total = len(self._visible_entries)
-        translated = sum(1 for e in self._visible_entries if e.status in ("translated", "reviewed"))
-        reviewed = sum(1 for e in self._visible_entries if e.status == "reviewed")
+        visible = self._visible_entries
+        total = len(visible)
+        # Edits bump _data_version and filters swap the list, so the counts
+        # only need recomputing when either moved — repeat calls with nothing
+        # changed in between (e.g. status_changed re-entry) reuse them.
+        # The tally is one C-level pass: map() + list.count(), no Python loop
+        cached = self._stats_cache
+        if (cached is not None and cached[0] is visible and cached[1] == total
+                and cached[2] == self._data_version):
+            translated, reviewed = cached[3]
+        else:
+            statuses = list(map(_get_status, visible))
+            reviewed = statuses.count("reviewed")
+            translated = statuses.count("translated") + reviewed
+            self._stats_cache = (visible, total, self._data_version, (translated, reviewed))
         self.stats_label.setText(
             f"Showing {total} entries  |  "
             f"Translated: {translated}  |  Reviewed: {reviewed}"
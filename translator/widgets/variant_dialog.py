@@ -2,7 +2,7 @@
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTextEdit, QGroupBox, QRadioButton, QButtonGroup,
+    QTextEdit, QGroupBox, QRadioButton, QButtonGroup, QFrame,
 )
 from PyQt6.QtCore import Qt
 
@@ -48,9 +48,14 @@ class VariantDialog(QDialog):
             self._button_group.addButton(radio, i)
             group_layout.addWidget(radio, 0)
 
-            text = QTextEdit()
-            text.setPlainText(variant)
-            text.setReadOnly(True)
+            # Read-only display: a label skips QTextEdit's editable document.
+            # PlainText so tags like <br> in a variant show literally.
+            text = QLabel(variant)
+            text.setTextFormat(Qt.TextFormat.PlainText)
+            text.setWordWrap(True)
+            text.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+            text.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+            text.setFrameShape(QFrame.Shape.StyledPanel)
             text.setMinimumHeight(60)
             group_layout.addWidget(text, 1)
 